@@ -0,0 +1,97 @@
+import argparse
+import time
+import tracemalloc
+
+import pandas as pd
+
+from domain.processing.statistics import RollingStatisticsEngine, StatisticsEngine
+from standin.synthetic import generate_synthetic_league
+
+engines = {
+    'reference': StatisticsEngine,
+    'rolling': RollingStatisticsEngine
+}
+
+
+def _measure(fn) -> (float, int):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+
+    # Memory is traced in a separate run, since tracemalloc slows down the pure Python loops.
+    tracemalloc.start()
+    fn()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak_memory
+
+
+def benchmark_engine(
+        engine_name: str,
+        matches_df: pd.DataFrame,
+        last_n_matches: int,
+        goal_diff_margin: int,
+        statistic_columns: list
+) -> pd.DataFrame:
+    engine = engines[engine_name](
+        matches_df=matches_df, last_n_matches=last_n_matches, goal_diff_margin=goal_diff_margin
+    )
+    num_matches = matches_df.shape[0]
+    report = []
+
+    for column in statistic_columns:
+        elapsed, peak_memory = _measure(lambda: engine.compute_statistics(statistic_columns=[column]))
+        report.append((column, elapsed, num_matches / elapsed, peak_memory / 2 ** 20))
+
+    elapsed, peak_memory = _measure(lambda: engine.compute_statistics(statistic_columns=statistic_columns))
+    report.append(('compute_statistics', elapsed, num_matches / elapsed, peak_memory / 2 ** 20))
+    return pd.DataFrame(report, columns=['Stage', 'Seconds', 'Matches/sec', 'Peak MB'])
+
+
+def assert_engine_parity(
+        engine_name: str,
+        matches_df: pd.DataFrame,
+        last_n_matches: int,
+        goal_diff_margin: int,
+        statistic_columns: list
+):
+    expected_df = StatisticsEngine(
+        matches_df=matches_df, last_n_matches=last_n_matches, goal_diff_margin=goal_diff_margin
+    ).compute_statistics(statistic_columns=statistic_columns)
+    computed_df = engines[engine_name](
+        matches_df=matches_df, last_n_matches=last_n_matches, goal_diff_margin=goal_diff_margin
+    ).compute_statistics(statistic_columns=statistic_columns)
+    pd.testing.assert_frame_equal(expected_df, computed_df)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks StatisticsEngine on synthetic leagues')
+    parser.add_argument('--engine', choices=list(engines.keys()), default='rolling')
+    parser.add_argument('--teams', type=int, default=20)
+    parser.add_argument('--seasons', type=int, default=20)
+    parser.add_argument('--last-n-matches', type=int, default=3)
+    parser.add_argument('--goal-diff-margin', type=int, default=2)
+    parser.add_argument('--columns', nargs='+', default=StatisticsEngine.Columns)
+    parser.add_argument('--skip-parity', action='store_true')
+    args = parser.parse_args()
+
+    league_df = generate_synthetic_league(num_teams=args.teams, num_seasons=args.seasons)
+    print(f'Synthetic league: {args.teams} teams, {args.seasons} seasons, {league_df.shape[0]} matches')
+
+    if not args.skip_parity and args.engine != 'reference':
+        assert_engine_parity(
+            engine_name=args.engine,
+            matches_df=league_df,
+            last_n_matches=args.last_n_matches,
+            goal_diff_margin=args.goal_diff_margin,
+            statistic_columns=args.columns
+        )
+        print('Parity with the reference engine: OK')
+
+    print(benchmark_engine(
+        engine_name=args.engine,
+        matches_df=league_df,
+        last_n_matches=args.last_n_matches,
+        goal_diff_margin=args.goal_diff_margin,
+        statistic_columns=args.columns
+    ).to_string(index=False))
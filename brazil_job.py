@@ -5,17 +5,30 @@ import schedule
 
 import variables
 from domain.usecases.job_train import JobTrainUseCase
+from infra.clients.footystats.footystats import FootystatsClient
+from infra.repositories.feature_store import FeatureStore
 from infra.repositories.league import LeagueRepository
 from infra.repositories.model import ModelRepository
 
 
 def execute():
+    feature_store = FeatureStore(features_directory=variables.feature_store_directory,
+                                 max_size_bytes=variables.feature_store_max_size_bytes)
     league_repository = LeagueRepository(available_leagues_filepath=variables.available_leagues_filepath,
-                                         saved_leagues_directory=variables.saved_leagues_directory)
+                                         saved_leagues_directory=variables.saved_leagues_directory,
+                                         feature_store=feature_store,
+                                         raw_data_directory=variables.raw_data_directory,
+                                         num_previous_versions=variables.num_previous_league_versions)
 
     model_repository = ModelRepository(models_checkpoint_directory=variables.models_checkpoint_directory)
 
-    use_case = JobTrainUseCase(league_repository=league_repository, model_repository=model_repository)
+    footystats_client = FootystatsClient(api_key=variables.footystats_api_key,
+                                         cache_directory=variables.footystats_cache_directory)
+
+    use_case = JobTrainUseCase(league_repository=league_repository, model_repository=model_repository,
+                               footystats_client=footystats_client,
+                               fixtures_directory=variables.fixtures_directory,
+                               team_names_directory=variables.team_names_directory)
     use_case.execute(country="Brazil")
 
 
@@ -0,0 +1,88 @@
+import bisect
+import numpy as np
+from domain.processing.history import MatchHistory
+
+
+class HeadToHeadIndex:
+    def __init__(self, match_history: MatchHistory):
+        self._home_teams = match_history.home_teams.tolist()
+        self._away_teams = match_history.away_teams.tolist()
+        self._results = match_history.results.tolist()
+        self._team_names = list(match_history.team_names)
+        self._team_codes = {team_name: team_code for team_code, team_name in enumerate(self._team_names)}
+
+        self._home_win = match_history.encode_result(result_value='H')
+        self._draw = match_history.encode_result(result_value='D')
+        self._away_win = match_history.encode_result(result_value='A')
+
+        self._meetings = {}
+        for match_id, (home_team, away_team) in enumerate(zip(self._home_teams, self._away_teams)):
+            if home_team != MatchHistory.MissingValue and away_team != MatchHistory.MissingValue:
+                self._meetings.setdefault(self._get_pair_key(home_team, away_team), []).append(match_id)
+
+    @staticmethod
+    def _get_pair_key(team_code: int, opponent_code: int) -> (int, int):
+        return (team_code, opponent_code) if team_code <= opponent_code else (opponent_code, team_code)
+
+    def _count_results(self, team_code: int, meeting_ids: list) -> (int, int, int):
+        wins = draws = losses = 0
+
+        for match_id in meeting_ids:
+            result = self._results[match_id]
+
+            if result == self._draw:
+                draws += 1
+            elif (result == self._home_win and self._home_teams[match_id] == team_code) or \
+                    (result == self._away_win and self._away_teams[match_id] == team_code):
+                wins += 1
+            elif result != MatchHistory.MissingValue:
+                losses += 1
+        return wins, draws, losses
+
+    def compute_statistics(self, num_meetings: int) -> np.ndarray:
+        statistics = np.full(shape=(len(self._home_teams), 3), fill_value=np.nan, dtype=np.float64)
+
+        for meeting_ids in self._meetings.values():
+            for i, match_id in enumerate(meeting_ids):
+                statistics[match_id] = self._count_results(
+                    team_code=self._home_teams[match_id], meeting_ids=meeting_ids[i + 1: i + 1 + num_meetings]
+                )
+        return statistics
+
+    def compute_match_statistics(self, match_ids: np.ndarray, num_meetings: int) -> np.ndarray:
+        statistics = np.full(shape=(len(match_ids), 3), fill_value=np.nan, dtype=np.float64)
+
+        for i, match_id in enumerate(match_ids):
+            home_team_code = self._home_teams[match_id]
+            away_team_code = self._away_teams[match_id]
+
+            if home_team_code != MatchHistory.MissingValue and away_team_code != MatchHistory.MissingValue:
+                meeting_ids = self._meetings[self._get_pair_key(home_team_code, away_team_code)]
+                first_previous_id = bisect.bisect_right(meeting_ids, match_id)
+                statistics[i] = self._count_results(
+                    team_code=home_team_code,
+                    meeting_ids=meeting_ids[first_previous_id: first_previous_id + num_meetings]
+                )
+        return statistics
+
+    def lookup(self, home_team: str, away_team: str, num_meetings: int) -> (int, int, int):
+        home_team_code = self._team_codes.get(home_team)
+        away_team_code = self._team_codes.get(away_team)
+
+        if home_team_code is None or away_team_code is None:
+            return 0, 0, 0
+
+        meeting_ids = self._meetings.get(self._get_pair_key(home_team_code, away_team_code), [])
+        return self._count_results(team_code=home_team_code, meeting_ids=meeting_ids[: num_meetings])
+
+    def compute_latest_statistics(self, num_meetings: int) -> list:
+        latest_statistics = []
+
+        for (team_code, opponent_code), meeting_ids in self._meetings.items():
+            for home_team_code, away_team_code in [(team_code, opponent_code), (opponent_code, team_code)]:
+                latest_statistics.append((
+                    self._team_names[home_team_code],
+                    self._team_names[away_team_code],
+                    *self._count_results(team_code=home_team_code, meeting_ids=meeting_ids[: num_meetings])
+                ))
+        return latest_statistics
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+
+class MatchHistory:
+    ResultCodes = {'H': 0, 'D': 1, 'A': 2}
+    MissingValue = -1
+
+    def __init__(self, matches_df: pd.DataFrame):
+        num_matches = matches_df.shape[0]
+        team_codes, team_names = pd.factorize(
+            np.concatenate((matches_df['Home Team'].to_numpy(dtype=object), matches_df['Away Team'].to_numpy(dtype=object)))
+        )
+
+        self._seasons = np.ascontiguousarray(matches_df['Season'].to_numpy(dtype=np.int16))
+        self._home_teams = np.ascontiguousarray(team_codes[: num_matches], dtype=np.int32)
+        self._away_teams = np.ascontiguousarray(team_codes[num_matches:], dtype=np.int32)
+        self._home_goals = self._encode_goals(goals=matches_df['HG'])
+        self._away_goals = self._encode_goals(goals=matches_df['AG'])
+        self._results = np.ascontiguousarray(
+            matches_df['Result'].map(self.ResultCodes).fillna(self.MissingValue).to_numpy(dtype=np.int8)
+        )
+        self._team_names = np.asarray(team_names, dtype=object)
+
+        self._columns = (
+            self._seasons, self._home_teams, self._away_teams, self._home_goals, self._away_goals, self._results
+        )
+
+    def _encode_goals(self, goals: pd.Series) -> np.ndarray:
+        goals = goals.to_numpy(dtype=np.float64)
+        return np.ascontiguousarray(np.where(np.isnan(goals), self.MissingValue, goals), dtype=np.int16)
+
+    def __getitem__(self, column_index: int) -> np.ndarray:
+        return self._columns[column_index]
+
+    def __len__(self) -> int:
+        return self._seasons.shape[0]
+
+    @property
+    def seasons(self) -> np.ndarray:
+        return self._seasons
+
+    @property
+    def home_teams(self) -> np.ndarray:
+        return self._home_teams
+
+    @property
+    def away_teams(self) -> np.ndarray:
+        return self._away_teams
+
+    @property
+    def home_goals(self) -> np.ndarray:
+        return self._home_goals
+
+    @property
+    def away_goals(self) -> np.ndarray:
+        return self._away_goals
+
+    @property
+    def results(self) -> np.ndarray:
+        return self._results
+
+    @property
+    def team_names(self) -> np.ndarray:
+        return self._team_names
+
+    def goals(self, goals_index: int) -> np.ndarray:
+        goals = self[goals_index].astype(np.float64)
+        goals[goals == self.MissingValue] = np.nan
+        return goals
+
+    def encode_result(self, result_value: str) -> int:
+        return self.ResultCodes[result_value]
@@ -1,5 +1,8 @@
+import itertools
 import numpy as np
 import pandas as pd
+from domain.processing.head_to_head import HeadToHeadIndex
+from domain.processing.history import MatchHistory
 
 
 class StatisticsEngine:
@@ -7,20 +10,29 @@ class StatisticsEngine:
         'HW', 'HL', 'HGF', 'HGA', 'HGDW', 'HGDL', 'HW%', 'HD%',
         'AW', 'AL', 'AGF', 'AGA', 'AGDW', 'AGDL', 'AW%', 'AD%',
     ]
+    FormColumns = ['HEW%', 'HEGF', 'HEGA', 'AEW%', 'AEGF', 'AEGA']
+    HeadToHeadColumns = ['VW', 'VD', 'VL']
+    DefaultFormDecayFactor = 0.8
+    HeadToHeadMatches = 5
+    Version = '1'
 
     def __init__(
             self,
             matches_df: pd.DataFrame,
             last_n_matches: int,
-            goal_diff_margin: int
+            goal_diff_margin: int,
+            form_decay_factor: float = DefaultFormDecayFactor
     ):
         self._matches_df = matches_df
-        self._match_history = matches_df[['Season', 'Home Team', 'Away Team', 'HG', 'AG', 'Result']].values
-        self._max_season = self._match_history[0, 0]
-        self._min_season = self._match_history[-1, 0]
+        self._match_history = MatchHistory(matches_df=matches_df)
+        self._max_season = int(self._match_history.seasons[0])
+        self._min_season = int(self._match_history.seasons[-1])
 
         self._last_n_matches = last_n_matches
         self._goal_diff_margin = goal_diff_margin
+        self._form_decay_factor = form_decay_factor
+        self._head_to_head_index = None
+        self._head_to_head_statistics = None
 
         self._statistics_mapper = {
             'HW': self._compute_last_n_home_wins,
@@ -38,7 +50,16 @@ class StatisticsEngine:
             'AGDW': self._compute_last_n_away_wins_goals_diff,
             'AGDL': self._compute_last_n_away_losses_goals_diff,
             'AW%': self._compute_total_home_win_rate,
-            'AD%': self._compute_total_home_draw_rate
+            'AD%': self._compute_total_home_draw_rate,
+            'HEW%': self._compute_home_form_win_rate,
+            'HEGF': self._compute_home_form_goals_forward,
+            'HEGA': self._compute_home_form_goals_against,
+            'AEW%': self._compute_away_form_win_rate,
+            'AEGF': self._compute_away_form_goals_forward,
+            'AEGA': self._compute_away_form_goals_against,
+            'VW': self._compute_head_to_head_wins,
+            'VD': self._compute_head_to_head_draws,
+            'VL': self._compute_head_to_head_losses
         }
 
     def compute_statistics(
@@ -50,7 +71,11 @@ class StatisticsEngine:
         for column in statistic_columns:
             matches_df[column] = self._statistics_mapper[column]()
         matches_df = matches_df.dropna()
-        matches_df[statistic_columns] = matches_df[statistic_columns].astype(dtype=np.int32)
+        return self._cast_statistics(matches_df=matches_df, statistic_columns=statistic_columns)
+
+    def _cast_statistics(self, matches_df: pd.DataFrame, statistic_columns: list) -> pd.DataFrame:
+        integer_columns = [column for column in statistic_columns if column not in self.FormColumns]
+        matches_df[integer_columns] = matches_df[integer_columns].astype(dtype=np.int32)
         return matches_df
 
     def _compute_last_n_home_wins(self) -> pd.Series:
@@ -65,26 +90,33 @@ class StatisticsEngine:
     def _compute_last_n_away_losses(self) -> pd.Series:
         return self._compute_last_results(team_index=2, target_result_value='H')
 
+    def _season_match_ids(self) -> list:
+        return [
+            np.flatnonzero(self._match_history.seasons == season)
+            for season in range(self._max_season, self._min_season - 1, -1)
+        ]
+
     def _compute_last_results(self, team_index: int, target_result_value: str):
+        target_result = self._match_history.encode_result(result_value=target_result_value)
         last_results = []
 
-        for season in range(self._max_season, self._min_season - 1, -1):
-            match_history = self._match_history[self._match_history[:, 0] == season]
+        for season_match_ids in self._season_match_ids():
+            team_codes = self._match_history[team_index][season_match_ids].tolist()
+            results = self._match_history.results[season_match_ids].tolist()
 
-            for i, match in enumerate(match_history):
-                team_name = match[team_index]
+            for i, team_code in enumerate(team_codes):
                 target_results = 0
                 last_n = 0
 
-                for previous_match in match_history[i + 1:]:
-                    if previous_match[team_index] == team_name:
-                        result = previous_match[5]
-                        last_n += 1
+                if team_code != MatchHistory.MissingValue:
+                    for j in range(i + 1, len(team_codes)):
+                        if team_codes[j] == team_code:
+                            last_n += 1
 
-                        if result == target_result_value:
-                            target_results += 1
-                    if last_n == self._last_n_matches:
-                        break
+                            if results[j] == target_result:
+                                target_results += 1
+                        if last_n == self._last_n_matches:
+                            break
                 last_results.append(target_results if last_n == self._last_n_matches else np.nan)
         return pd.Series(last_results)
 
@@ -101,22 +133,24 @@ class StatisticsEngine:
         return self._compute_last_goals(team_index=2, goals_index=3)
 
     def _compute_last_goals(self, team_index: int, goals_index: int):
+        all_goals = self._match_history.goals(goals_index=goals_index)
         last_goals = []
 
-        for season in range(self._max_season, self._min_season - 1, -1):
-            match_history = self._match_history[self._match_history[:, 0] == season]
+        for season_match_ids in self._season_match_ids():
+            team_codes = self._match_history[team_index][season_match_ids].tolist()
+            season_goals = all_goals[season_match_ids].tolist()
 
-            for i, match in enumerate(match_history):
-                team_name = match[team_index]
+            for i, team_code in enumerate(team_codes):
                 goals = 0
                 last_n = 0
 
-                for previous_match in match_history[i + 1:]:
-                    if previous_match[team_index] == team_name:
-                        goals += previous_match[goals_index]
-                        last_n += 1
-                    if last_n == self._last_n_matches:
-                        break
+                if team_code != MatchHistory.MissingValue:
+                    for j in range(i + 1, len(team_codes)):
+                        if team_codes[j] == team_code:
+                            goals += season_goals[j]
+                            last_n += 1
+                        if last_n == self._last_n_matches:
+                            break
                 last_goals.append(goals if last_n == self._last_n_matches else np.nan)
         return pd.Series(last_goals)
 
@@ -146,26 +180,28 @@ class StatisticsEngine:
             target_higher_goals_index: int,
             target_lower_goals_index: int
     ):
+        all_higher_goals = self._match_history.goals(goals_index=target_higher_goals_index)
+        all_lower_goals = self._match_history.goals(goals_index=target_lower_goals_index)
         last_results_with_goals_diff = []
 
-        for season in range(self._max_season, self._min_season - 1, -1):
-            match_history = self._match_history[self._match_history[:, 0] == season]
+        for season_match_ids in self._season_match_ids():
+            team_codes = self._match_history[team_index][season_match_ids].tolist()
+            higher_goals = all_higher_goals[season_match_ids].tolist()
+            lower_goals = all_lower_goals[season_match_ids].tolist()
 
-            for i, match in enumerate(match_history):
-                team_name = match[team_index]
+            for i, team_code in enumerate(team_codes):
                 target_results_with_goals_diff = 0
                 last_n = 0
 
-                for previous_match in match_history[i + 1:]:
-                    if previous_match[team_index] == team_name:
-                        target_higher_goals = previous_match[target_higher_goals_index]
-                        target_lower_goals = previous_match[target_lower_goals_index]
-                        last_n += 1
+                if team_code != MatchHistory.MissingValue:
+                    for j in range(i + 1, len(team_codes)):
+                        if team_codes[j] == team_code:
+                            last_n += 1
 
-                        if target_higher_goals - target_lower_goals >= self._goal_diff_margin:
-                            target_results_with_goals_diff += 1
-                    if last_n == self._last_n_matches:
-                        break
+                            if higher_goals[j] - lower_goals[j] >= self._goal_diff_margin:
+                                target_results_with_goals_diff += 1
+                        if last_n == self._last_n_matches:
+                            break
                 last_results_with_goals_diff.append(
                     target_results_with_goals_diff if last_n == self._last_n_matches else np.nan
                 )
@@ -184,24 +220,475 @@ class StatisticsEngine:
         return self._compute_total_results_rate(team_index=2, target_result_value='D')
 
     def _compute_total_results_rate(self, team_index: int, target_result_value: str):
+        target_result = self._match_history.encode_result(result_value=target_result_value)
         last_result_rates = []
 
-        for season in range(self._max_season, self._min_season - 1, -1):
-            match_history = self._match_history[self._match_history[:, 0] == season]
+        for season_match_ids in self._season_match_ids():
+            team_codes = self._match_history[team_index][season_match_ids].tolist()
+            results = self._match_history.results[season_match_ids].tolist()
 
-            for i, match in enumerate(match_history):
-                team_name = match[team_index]
+            for i, team_code in enumerate(team_codes):
                 target_results = 0
                 non_target_results = 0
 
-                for previous_match in match_history[i + 1:]:
-                    if previous_match[team_index] == team_name:
-                        result = previous_match[5]
-
-                        if result == target_result_value:
-                            target_results += 1
-                        else:
-                            non_target_results += 1
+                if team_code != MatchHistory.MissingValue:
+                    for j in range(i + 1, len(team_codes)):
+                        if team_codes[j] == team_code:
+                            if results[j] == target_result:
+                                target_results += 1
+                            else:
+                                non_target_results += 1
                 total_results = target_results + non_target_results
                 last_result_rates.append(np.nan if total_results == 0 else round(target_results * 100 / total_results))
         return pd.Series(last_result_rates)
+
+    def _compute_home_form_win_rate(self) -> pd.Series:
+        return self._compute_form_results(team_index=1, target_result_value='H')
+
+    def _compute_away_form_win_rate(self) -> pd.Series:
+        return self._compute_form_results(team_index=2, target_result_value='A')
+
+    def _compute_home_form_goals_forward(self) -> pd.Series:
+        return self._compute_form_goals(team_index=1, goals_index=3)
+
+    def _compute_home_form_goals_against(self) -> pd.Series:
+        return self._compute_form_goals(team_index=1, goals_index=4)
+
+    def _compute_away_form_goals_forward(self) -> pd.Series:
+        return self._compute_form_goals(team_index=2, goals_index=4)
+
+    def _compute_away_form_goals_against(self) -> pd.Series:
+        return self._compute_form_goals(team_index=2, goals_index=3)
+
+    def _compute_form_results(self, team_index: int, target_result_value: str):
+        target_result = self._match_history.encode_result(result_value=target_result_value)
+        targets = (self._match_history.results == target_result).astype(np.float64)
+        return self._compute_form(team_index=team_index, values=targets * 100)
+
+    def _compute_form_goals(self, team_index: int, goals_index: int):
+        return self._compute_form(team_index=team_index, values=self._match_history.goals(goals_index=goals_index))
+
+    def _compute_form(self, team_index: int, values: np.ndarray):
+        forms = []
+
+        for season_match_ids in self._season_match_ids():
+            team_codes = self._match_history[team_index][season_match_ids].tolist()
+            season_values = values[season_match_ids].tolist()
+
+            for i, team_code in enumerate(team_codes):
+                weighted_values = 0.0
+                weights = 0.0
+                weight = 1.0
+
+                if team_code != MatchHistory.MissingValue:
+                    for j in range(i + 1, len(team_codes)):
+                        if team_codes[j] == team_code:
+                            if not np.isnan(season_values[j]):
+                                weighted_values += weight * season_values[j]
+                                weights += weight
+                            weight *= self._form_decay_factor
+                forms.append(np.nan if weights == 0 else weighted_values / weights)
+        return pd.Series(forms)
+
+    @property
+    def head_to_head_index(self) -> HeadToHeadIndex:
+        if self._head_to_head_index is None:
+            self._head_to_head_index = HeadToHeadIndex(match_history=self._match_history)
+        return self._head_to_head_index
+
+    def _compute_head_to_head_wins(self) -> pd.Series:
+        return self._compute_head_to_head_results(result_index=0)
+
+    def _compute_head_to_head_draws(self) -> pd.Series:
+        return self._compute_head_to_head_results(result_index=1)
+
+    def _compute_head_to_head_losses(self) -> pd.Series:
+        return self._compute_head_to_head_results(result_index=2)
+
+    def _get_head_to_head_statistics(self) -> np.ndarray:
+        if self._head_to_head_statistics is None:
+            self._head_to_head_statistics = self.head_to_head_index.compute_statistics(
+                num_meetings=self.HeadToHeadMatches
+            )
+        return self._head_to_head_statistics
+
+    def _compute_head_to_head_results(self, result_index: int) -> pd.Series:
+        return pd.Series(self._get_head_to_head_statistics()[:, result_index], index=self._matches_df.index)
+
+
+class StatisticsCube:
+    def __init__(
+            self,
+            matches_df: pd.DataFrame,
+            statistic_columns: list,
+            window_columns: list,
+            parameters: list,
+            window_statistics: np.ndarray,
+            integer_columns: list
+    ):
+        self._matches_df = matches_df
+        self._columns = [column for column in matches_df.columns if column not in statistic_columns] + statistic_columns
+        self._window_columns = window_columns
+        self._parameters = parameters
+        self._parameter_ids = {parameter: i for i, parameter in enumerate(parameters)}
+        self._window_statistics = window_statistics
+        self._integer_columns = integer_columns
+
+    @property
+    def parameters(self) -> list:
+        return self._parameters
+
+    def __len__(self) -> int:
+        return len(self._parameters)
+
+    def get(self, last_n_matches: int, goal_diff_margin: int) -> pd.DataFrame:
+        return self.get_by_id(parameters_id=self._parameter_ids[(last_n_matches, goal_diff_margin)])
+
+    def get_by_id(self, parameters_id: int) -> pd.DataFrame:
+        matches_df = self._matches_df.assign(
+            **dict(zip(self._window_columns, self._window_statistics[parameters_id].T))
+        )[self._columns]
+        matches_df = matches_df.dropna()
+        matches_df[self._integer_columns] = matches_df[self._integer_columns].astype(dtype=np.int32)
+        return matches_df
+
+
+class RollingStatisticsEngine(StatisticsEngine):
+    ColumnSpecs = {
+        'HW': ('last_results', 1, 'H'),
+        'HL': ('last_results', 1, 'A'),
+        'HGF': ('last_goals', 1, 3),
+        'HGA': ('last_goals', 1, 4),
+        'HGDW': ('last_goals_diff', 1, 3, 4),
+        'HGDL': ('last_goals_diff', 1, 4, 3),
+        'HW%': ('total_rate', 1, 'H'),
+        'HD%': ('total_rate', 1, 'D'),
+        'AW': ('last_results', 2, 'A'),
+        'AL': ('last_results', 2, 'H'),
+        'AGF': ('last_goals', 2, 4),
+        'AGA': ('last_goals', 2, 3),
+        'AGDW': ('last_goals_diff', 2, 4, 3),
+        'AGDL': ('last_goals_diff', 2, 3, 4),
+        'AW%': ('total_rate', 1, 'H'),
+        'AD%': ('total_rate', 1, 'D'),
+        'HEW%': ('form_results', 1, 'H'),
+        'HEGF': ('form_goals', 1, 3),
+        'HEGA': ('form_goals', 1, 4),
+        'AEW%': ('form_results', 2, 'A'),
+        'AEGF': ('form_goals', 2, 4),
+        'AEGA': ('form_goals', 2, 3),
+        'VW': ('head_to_head', 0, 0),
+        'VD': ('head_to_head', 0, 1),
+        'VL': ('head_to_head', 0, 2)
+    }
+    WindowKernels = {'last_results', 'last_goals', 'last_goals_diff'}
+    FormKernels = {'form_results', 'form_goals'}
+
+    def compute_statistics(
+            self,
+            statistic_columns: list,
+            fused: bool = True
+    ) -> pd.DataFrame:
+        if not fused:
+            return super().compute_statistics(statistic_columns=statistic_columns)
+
+        window_columns = self._get_window_columns(statistic_columns=statistic_columns)
+        statistics, window_statistics = self._compute_statistics_arrays(
+            statistic_columns=statistic_columns,
+            last_n_matches_list=[self._last_n_matches],
+            goal_diff_margins=[self._goal_diff_margin]
+        )
+        statistics[:, [statistic_columns.index(column) for column in window_columns]] = window_statistics[0]
+
+        matches_df = self._matches_df.assign(**dict(zip(statistic_columns, statistics.T)))
+        matches_df = matches_df.dropna()
+        return self._cast_statistics(matches_df=matches_df, statistic_columns=statistic_columns)
+
+    def compute_statistics_cube(
+            self,
+            statistic_columns: list,
+            last_n_matches_list: list,
+            goal_diff_margins: list
+    ) -> StatisticsCube:
+        window_columns = self._get_window_columns(statistic_columns=statistic_columns)
+        statistics, window_statistics = self._compute_statistics_arrays(
+            statistic_columns=statistic_columns,
+            last_n_matches_list=last_n_matches_list,
+            goal_diff_margins=goal_diff_margins
+        )
+        return StatisticsCube(
+            matches_df=self._matches_df.assign(**{
+                column: statistics[:, i] for i, column in enumerate(statistic_columns) if column not in window_columns
+            }),
+            statistic_columns=statistic_columns,
+            window_columns=window_columns,
+            parameters=list(itertools.product(last_n_matches_list, goal_diff_margins)),
+            window_statistics=window_statistics,
+            integer_columns=[column for column in statistic_columns if column not in self.FormColumns]
+        )
+
+    def _get_window_columns(self, statistic_columns: list) -> list:
+        return [column for column in statistic_columns if self.ColumnSpecs[column][0] in self.WindowKernels]
+
+    def _compute_statistics_arrays(
+            self,
+            statistic_columns: list,
+            last_n_matches_list: list,
+            goal_diff_margins: list
+    ) -> (np.ndarray, np.ndarray):
+        window_columns = self._get_window_columns(statistic_columns=statistic_columns)
+        num_matches = len(self._match_history)
+        num_parameters = len(last_n_matches_list) * len(goal_diff_margins)
+
+        # Window columns depend on (last_n_matches, goal_diff_margin), so they get one layer per parameter pair.
+        # Every other column is shared by all pairs and is left as NaN in the window slots of the shared array.
+        statistics = np.full(shape=(num_matches, len(statistic_columns)), fill_value=np.nan, dtype=np.float64)
+        window_statistics = np.full(
+            shape=(num_parameters, num_matches, len(window_columns)), fill_value=np.nan, dtype=np.float64
+        )
+
+        head_to_head_columns = [
+            (i, self.ColumnSpecs[column][2]) for i, column in enumerate(statistic_columns)
+            if self.ColumnSpecs[column][0] == 'head_to_head'
+        ]
+        if len(head_to_head_columns) > 0:
+            column_ids, result_indices = zip(*head_to_head_columns)
+            statistics[:, list(column_ids)] = self._get_head_to_head_statistics()[:, list(result_indices)]
+
+        for team_index in sorted({self.ColumnSpecs[column][1] for column in statistic_columns} - {0}):
+            group = self._group_positions(team_index=team_index)
+            order = group[0]
+
+            group_window_columns = [
+                (i, self.ColumnSpecs[column]) for i, column in enumerate(window_columns)
+                if self.ColumnSpecs[column][1] == team_index
+            ]
+            if len(group_window_columns) > 0:
+                column_ids = [i for i, _ in group_window_columns]
+                window_sums = self._compute_window_block(
+                    group=group,
+                    column_specs=[spec for _, spec in group_window_columns],
+                    last_n_matches_list=last_n_matches_list,
+                    goal_diff_margins=goal_diff_margins
+                )
+                window_statistics[np.ix_(np.arange(num_parameters), order, column_ids)] = window_sums
+
+            group_columns = [
+                (i, self.ColumnSpecs[column]) for i, column in enumerate(statistic_columns)
+                if self.ColumnSpecs[column][1] == team_index and column not in window_columns
+            ]
+            if len(group_columns) > 0:
+                column_ids = [i for i, _ in group_columns]
+                statistics[np.ix_(order, column_ids)] = self._compute_shared_block(
+                    group=group, column_specs=[spec for _, spec in group_columns]
+                )
+        return statistics, window_statistics
+
+    def _compute_window_block(
+            self,
+            group: tuple,
+            column_specs: list,
+            last_n_matches_list: list,
+            goal_diff_margins: list
+    ) -> np.ndarray:
+        values = []
+        values_ids = {}
+        column_values_ids = np.empty(shape=(len(goal_diff_margins), len(column_specs)), dtype=np.int64)
+
+        for j, (kernel_name, _, *kernel_args) in enumerate(column_specs):
+            for k, goal_diff_margin in enumerate(goal_diff_margins):
+                margin = goal_diff_margin if kernel_name == 'last_goals_diff' else None
+                values_key = (kernel_name, *kernel_args, margin)
+
+                if values_key not in values_ids:
+                    values_ids[values_key] = len(values)
+                    values.append(self._window_values(
+                        kernel_name=kernel_name, kernel_args=kernel_args, goal_diff_margin=goal_diff_margin
+                    ))
+                column_values_ids[k, j] = values_ids[values_key]
+
+        window_sums = self._window_sums(
+            group=group,
+            prefix_sums=self._prefix_sums(group=group, values=np.stack(values, axis=1)),
+            last_n_matches_list=last_n_matches_list
+        )
+
+        # (last_n, match, values) -> (last_n, match, margin, column), flattened to one layer per parameter pair.
+        window_sums = window_sums[:, :, column_values_ids].transpose((0, 2, 1, 3))
+        return window_sums.reshape((-1, window_sums.shape[2], window_sums.shape[3]))
+
+    def _compute_shared_block(self, group: tuple, column_specs: list) -> np.ndarray:
+        rate_ids = [j for j, spec in enumerate(column_specs) if spec[0] == 'total_rate']
+        form_ids = [j for j, spec in enumerate(column_specs) if spec[0] in self.FormKernels]
+        block = np.empty(shape=(group[0].shape[0], len(column_specs)), dtype=np.float64)
+
+        if len(rate_ids) > 0:
+            block[:, rate_ids] = self._total_rate_kernel(
+                group=group, target_result_values=[column_specs[j][2] for j in rate_ids]
+            )
+        if len(form_ids) > 0:
+            block[:, form_ids] = self._form_kernel(
+                group=group,
+                values=np.stack([
+                    self._form_values(kernel_name=column_specs[j][0], kernel_args=column_specs[j][2:])
+                    for j in form_ids
+                ], axis=1)
+            )
+        return block
+
+    def _group_positions(self, team_index: int) -> (np.ndarray, np.ndarray, np.ndarray):
+        seasons = self._match_history.seasons
+        team_codes = self._match_history[team_index]
+        order = np.lexsort((team_codes, seasons))
+        order = order[team_codes[order] >= 0]
+
+        sorted_seasons = seasons[order]
+        sorted_teams = team_codes[order]
+        group_starts = np.flatnonzero(np.concatenate((
+            [True], (sorted_seasons[1:] != sorted_seasons[:-1]) | (sorted_teams[1:] != sorted_teams[:-1])
+        )))
+        group_sizes = np.diff(np.append(group_starts, order.shape[0]))
+        group_ends = np.repeat(group_starts + group_sizes, group_sizes)
+        num_previous_matches = group_ends - np.arange(order.shape[0]) - 1
+        return order, group_ends, num_previous_matches
+
+    def _scatter(self, order: np.ndarray, values: np.ndarray) -> np.ndarray:
+        statistics = np.full(shape=len(self._match_history), fill_value=np.nan, dtype=np.float64)
+        statistics[order] = values
+        return statistics
+
+    def _window_values(self, kernel_name: str, kernel_args: tuple, goal_diff_margin: int) -> np.ndarray:
+        if kernel_name == 'last_results':
+            target_result = self._match_history.encode_result(result_value=kernel_args[0])
+            return (self._match_history.results == target_result).astype(np.float64)
+        elif kernel_name == 'last_goals':
+            return self._match_history.goals(goals_index=kernel_args[0])
+        elif kernel_name == 'last_goals_diff':
+            goals_diff = (
+                self._match_history.goals(goals_index=kernel_args[0]) -
+                self._match_history.goals(goals_index=kernel_args[1])
+            )
+            return (goals_diff >= goal_diff_margin).astype(np.float64)
+        else:
+            raise NotImplementedError(f'Window kernel "{kernel_name}" has not been implemented')
+
+    @staticmethod
+    def _prefix_sums(group: tuple, values: np.ndarray) -> (np.ndarray, np.ndarray):
+        order, _, _ = group
+        values = values[order]
+        missing = np.isnan(values)
+        values_cumsum = np.concatenate((
+            np.zeros(shape=(1, values.shape[1]), dtype=np.float64), np.cumsum(np.where(missing, 0.0, values), axis=0)
+        ))
+        missing_cumsum = np.concatenate((
+            np.zeros(shape=(1, values.shape[1]), dtype=np.int64), np.cumsum(missing, axis=0)
+        ))
+        return values_cumsum, missing_cumsum
+
+    @staticmethod
+    def _window_sums(group: tuple, prefix_sums: tuple, last_n_matches_list: list) -> np.ndarray:
+        order, _, num_previous_matches = group
+        values_cumsum, missing_cumsum = prefix_sums
+
+        # All window sizes and value columns are differenced at once: the result is (last_n, match, values).
+        positions = np.arange(order.shape[0])
+        last_n_matches = np.int64(last_n_matches_list).reshape((-1, 1))
+        window_ends = np.minimum(positions + 1 + last_n_matches, order.shape[0])
+        sums = values_cumsum[window_ends] - values_cumsum[positions + 1]
+        has_missing = missing_cumsum[window_ends] - missing_cumsum[positions + 1] > 0
+        sums[has_missing | (num_previous_matches < last_n_matches)[:, :, None]] = np.nan
+        return sums
+
+    def _total_rate_kernel(self, group: tuple, target_result_values: list) -> np.ndarray:
+        order, group_ends, num_previous_matches = group
+        results = self._match_history.results[order]
+        targets = np.stack([
+            results == self._match_history.encode_result(result_value=target_result_value)
+            for target_result_value in target_result_values
+        ], axis=1).astype(np.float64)
+        targets_cumsum = np.concatenate((np.zeros(shape=(1, targets.shape[1])), np.cumsum(targets, axis=0)))
+
+        positions = np.arange(order.shape[0])
+        target_results = targets_cumsum[group_ends] - targets_cumsum[positions + 1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates = np.round(target_results * 100 / num_previous_matches[:, None])
+        rates[num_previous_matches == 0] = np.nan
+        return rates
+
+    def _form_values(self, kernel_name: str, kernel_args: tuple) -> np.ndarray:
+        if kernel_name == 'form_results':
+            target_result = self._match_history.encode_result(result_value=kernel_args[0])
+            return (self._match_history.results == target_result).astype(np.float64) * 100
+        elif kernel_name == 'form_goals':
+            return self._match_history.goals(goals_index=kernel_args[0])
+        else:
+            raise NotImplementedError(f'Form kernel "{kernel_name}" has not been implemented')
+
+    def _form_kernel(self, group: tuple, values: np.ndarray) -> np.ndarray:
+        order, _, num_previous_matches = group
+        values = values[order]
+        present = ~np.isnan(values)
+        values = np.where(present, values, 0.0)
+        weighted_values = np.zeros(shape=values.shape, dtype=np.float64)
+        weights = np.zeros(shape=values.shape, dtype=np.float64)
+
+        # Each match carries its team's decayed sums forward to the next match in the same group. All teams advance
+        # together, one match per step, so the recurrence costs one vectorized step per match of the longest group.
+        layers_order = np.argsort(num_previous_matches, kind='stable')
+        layers = np.split(layers_order, np.flatnonzero(np.diff(num_previous_matches[layers_order])) + 1)
+        for match_ids in layers[1:]:
+            previous_match_ids = match_ids + 1
+            weighted_values[match_ids] = (
+                values[previous_match_ids] + self._form_decay_factor * weighted_values[previous_match_ids]
+            )
+            weights[match_ids] = present[previous_match_ids] + self._form_decay_factor * weights[previous_match_ids]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            forms = np.where(weights > 0, weighted_values / weights, np.nan)
+        return forms
+
+    def _compute_window_statistic(self, kernel_name: str, team_index: int, *kernel_args) -> pd.Series:
+        group = self._group_positions(team_index=team_index)
+        values = self._window_values(
+            kernel_name=kernel_name, kernel_args=kernel_args, goal_diff_margin=self._goal_diff_margin
+        )
+        window_sums = self._window_sums(
+            group=group,
+            prefix_sums=self._prefix_sums(group=group, values=values.reshape((-1, 1))),
+            last_n_matches_list=[self._last_n_matches]
+        )
+        return pd.Series(self._scatter(order=group[0], values=window_sums[0, :, 0]), index=self._matches_df.index)
+
+    def _compute_last_results(self, team_index: int, target_result_value: str):
+        return self._compute_window_statistic('last_results', team_index, target_result_value)
+
+    def _compute_last_goals(self, team_index: int, goals_index: int):
+        return self._compute_window_statistic('last_goals', team_index, goals_index)
+
+    def _compute_last_results_with_goals_diff(
+            self,
+            team_index: int,
+            target_higher_goals_index: int,
+            target_lower_goals_index: int
+    ):
+        return self._compute_window_statistic(
+            'last_goals_diff', team_index, target_higher_goals_index, target_lower_goals_index
+        )
+
+    def _compute_total_results_rate(self, team_index: int, target_result_value: str):
+        group = self._group_positions(team_index=team_index)
+        rates = self._total_rate_kernel(group=group, target_result_values=[target_result_value])
+        return pd.Series(self._scatter(order=group[0], values=rates[:, 0]), index=self._matches_df.index)
+
+    def _compute_form_statistic(self, kernel_name: str, team_index: int, *kernel_args) -> pd.Series:
+        group = self._group_positions(team_index=team_index)
+        forms = self._form_kernel(
+            group=group, values=self._form_values(kernel_name=kernel_name, kernel_args=kernel_args).reshape((-1, 1))
+        )
+        return pd.Series(self._scatter(order=group[0], values=forms[:, 0]), index=self._matches_df.index)
+
+    def _compute_form_results(self, team_index: int, target_result_value: str):
+        return self._compute_form_statistic('form_results', team_index, target_result_value)
+
+    def _compute_form_goals(self, team_index: int, goals_index: int):
+        return self._compute_form_statistic('form_goals', team_index, goals_index)
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+from domain.processing.head_to_head import HeadToHeadIndex
+from domain.processing.history import MatchHistory
+from domain.processing.statistics import StatisticsEngine
+
+
+class TeamForm:
+    NonFeatureColumns = ['Season', 'Date', 'Result', 'Home Team', 'Away Team', 'HG', 'AG']
+    TeamColumn = 'Team'
+    OpponentColumn = 'Opponent'
+
+    def __init__(self, form_df: pd.DataFrame):
+        feature_columns = [col for col in form_df.columns if col not in [self.TeamColumn, self.OpponentColumn]]
+        self._home_columns = [col for col in feature_columns if col[0] == 'H']
+        self._away_columns = [col for col in feature_columns if col[0] == 'A']
+        self._head_to_head_columns = [col for col in feature_columns if col[0] == 'V']
+        self._form_df = form_df
+
+        is_team_row = form_df[self.OpponentColumn].isna().to_numpy()
+        team_df = form_df[is_team_row]
+        self._team_ids = {team: i for i, team in enumerate(team_df[self.TeamColumn].tolist())}
+        self._home_features = team_df[self._home_columns].to_numpy(dtype=np.float64)
+        self._away_features = team_df[self._away_columns].to_numpy(dtype=np.float64)
+
+        # A team seen only at home (or only away) has NaN features for the other context, e.g. a newly
+        # promoted team after its first match, so it cannot be served in that context yet.
+        self._has_home_features = ~np.isnan(self._home_features).any(axis=1)
+        self._has_away_features = ~np.isnan(self._away_features).any(axis=1)
+
+        head_to_head_df = form_df[~is_team_row]
+        self._head_to_head_features = dict(zip(
+            zip(head_to_head_df[self.TeamColumn].tolist(), head_to_head_df[self.OpponentColumn].tolist()),
+            head_to_head_df[self._head_to_head_columns].to_numpy(dtype=np.float64)
+        ))
+
+    @classmethod
+    def build(cls, matches_df: pd.DataFrame, history_df: pd.DataFrame or None = None) -> 'TeamForm':
+        feature_columns = [col for col in matches_df.columns if col not in cls.NonFeatureColumns]
+        home_columns = [col for col in feature_columns if col[0] == 'H']
+        away_columns = [col for col in feature_columns if col[0] == 'A']
+        head_to_head_columns = [col for col in feature_columns if col[0] == 'V']
+
+        # Matches are stored newest first, so the first row of each team is its latest home or away context.
+        team_matches_df = matches_df.astype({'Home Team': object, 'Away Team': object})
+        home_df = team_matches_df.dropna(subset=['Home Team']).drop_duplicates(subset='Home Team')
+        away_df = team_matches_df.dropna(subset=['Away Team']).drop_duplicates(subset='Away Team')
+        form_df = home_df.set_index('Home Team')[home_columns].join(
+            away_df.set_index('Away Team')[away_columns], how='outer'
+        ).rename_axis(cls.TeamColumn).reset_index()
+        form_df.insert(1, cls.OpponentColumn, None)
+
+        # The stored league has dropped its incomplete early-season rows, and with them meetings that the training
+        # statistics did count, so head-to-head rows are taken from the full match history when it is given.
+        if len(head_to_head_columns) > 0:
+            history_df = matches_df if history_df is None else history_df
+            head_to_head_df = pd.DataFrame(
+                HeadToHeadIndex(match_history=MatchHistory(matches_df=history_df)).compute_latest_statistics(
+                    num_meetings=StatisticsEngine.HeadToHeadMatches
+                ),
+                columns=[cls.TeamColumn, cls.OpponentColumn] + StatisticsEngine.HeadToHeadColumns
+            )[[cls.TeamColumn, cls.OpponentColumn] + head_to_head_columns]
+            form_df = pd.concat((form_df, head_to_head_df), ignore_index=True)
+
+        form_df[cls.OpponentColumn] = form_df[cls.OpponentColumn].astype(object)
+        return cls(form_df=form_df)
+
+    def to_frame(self) -> pd.DataFrame:
+        return self._form_df
+
+    @property
+    def head_to_head_columns(self) -> list:
+        return self._head_to_head_columns
+
+    @property
+    def teams(self) -> list:
+        return list(self._team_ids)
+
+    def has_team(self, team: str) -> bool:
+        return team in self._team_ids
+
+    def _get_team_ids(self, teams: list) -> np.ndarray:
+        return np.int64([self._team_ids.get(team, -1) for team in teams])
+
+    def construct_inputs(self, home_teams: list, away_teams: list, odds: np.ndarray) -> np.ndarray:
+        home_team_ids = self._get_team_ids(teams=home_teams)
+        away_team_ids = self._get_team_ids(teams=away_teams)
+        unknown_teams = sorted(
+            {team for team, team_id in zip(home_teams, home_team_ids) if team_id == -1} |
+            {team for team, team_id in zip(away_teams, away_team_ids) if team_id == -1}
+        )
+
+        if len(unknown_teams) > 0:
+            raise ValueError(f'Teams {unknown_teams} have no matches in the league')
+
+        incomplete_teams = sorted(
+            {team for team, team_id in zip(home_teams, home_team_ids) if not self._has_home_features[team_id]} |
+            {team for team, team_id in zip(away_teams, away_team_ids) if not self._has_away_features[team_id]}
+        )
+
+        if len(incomplete_teams) > 0:
+            raise ValueError(f'Teams {incomplete_teams} have no matches in the league in the requested context')
+
+        num_home_columns = len(self._home_columns)
+        num_away_columns = len(self._away_columns)
+        inputs = np.empty(
+            shape=(len(home_teams), 3 + num_home_columns + num_away_columns + len(self._head_to_head_columns)),
+            dtype=np.float64
+        )
+        inputs[:, : 3] = odds
+        inputs[:, 3: 3 + num_home_columns] = self._home_features[home_team_ids]
+        inputs[:, 3 + num_home_columns: 3 + num_home_columns + num_away_columns] = self._away_features[away_team_ids]
+
+        for i, (home_team, away_team) in enumerate(zip(home_teams, away_teams)):
+            inputs[i, 3 + num_home_columns + num_away_columns:] = self.get_head_to_head_features(
+                home_team=home_team, away_team=away_team
+            )
+        return inputs
+
+    def _get_team_id(self, team: str) -> int:
+        if team not in self._team_ids:
+            raise KeyError(f'Team {team} has no matches in the league')
+        return self._team_ids[team]
+
+    def get_home_features(self, team: str) -> np.ndarray:
+        team_id = self._get_team_id(team=team)
+
+        if not self._has_home_features[team_id]:
+            raise KeyError(f'Team {team} has no home matches in the league')
+        return self._home_features[team_id]
+
+    def get_away_features(self, team: str) -> np.ndarray:
+        team_id = self._get_team_id(team=team)
+
+        if not self._has_away_features[team_id]:
+            raise KeyError(f'Team {team} has no away matches in the league')
+        return self._away_features[team_id]
+
+    def get_head_to_head_features(self, home_team: str, away_team: str) -> np.ndarray:
+        # Known teams that never met have no head-to-head row and get zero counts, as in training.
+        self._get_team_id(team=home_team)
+        self._get_team_id(team=away_team)
+        return self._head_to_head_features.get(
+            (home_team, away_team), np.zeros(len(self._head_to_head_columns), dtype=np.float64)
+        )
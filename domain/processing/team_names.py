@@ -0,0 +1,126 @@
+import json
+import os
+import re
+import unicodedata
+
+from fuzzywuzzy import fuzz, process
+
+from infra.converters.team import teams
+from infra.repositories.storage import write_text
+
+
+class TeamNameResolver:
+    IgnoredTokens = {'fc', 'afc', 'cf', 'sc', 'ec', 'ac', 'club', 'town', 'city', 'rb'}
+    IgnoredPhrases = ['red bull']
+
+    def __init__(
+            self,
+            team_names: list,
+            aliases: dict or None = None,
+            memo_filepath: str or None = None,
+            min_score: int = 90
+    ):
+        self._team_names = {team_name for team_name in team_names if isinstance(team_name, str)}
+        self._memo_filepath = memo_filepath
+        self._min_score = min_score
+        self._index = {}
+        self._resolved = {}
+
+        # League names take precedence over aliases that happen to normalize to the same key.
+        for team_name in sorted(self._team_names):
+            self._index.setdefault(self._normalize(name=team_name), team_name)
+        for alias, team_name in (teams if aliases is None else aliases).items():
+            team_name = self._index.get(self._normalize(name=team_name))
+            if team_name is not None:
+                self._index.setdefault(self._normalize(name=alias), team_name)
+
+        self._memo = self._load_memo()
+
+    @classmethod
+    def for_league(
+            cls,
+            team_names: list,
+            league_name: str,
+            team_names_directory: str or None = None
+    ) -> 'TeamNameResolver':
+        return cls(
+            team_names=team_names,
+            memo_filepath=None if team_names_directory is None else f'{team_names_directory}{league_name}.json'
+        )
+
+    @classmethod
+    def _normalize(cls, name: str) -> str:
+        name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii').lower()
+        name = f' {" ".join(re.findall(r"[a-z0-9]+", name))} '
+        for phrase in cls.IgnoredPhrases:
+            name = name.replace(f' {phrase} ', ' ')
+        return ' '.join(token for token in name.split() if token not in cls.IgnoredTokens)
+
+    def _load_memo(self) -> dict:
+        if self._memo_filepath is None:
+            return {}
+
+        try:
+            with open(self._memo_filepath, 'r', encoding='utf-8') as fp:
+                memo = json.load(fp)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+        # Entries pointing at teams that left the league are dropped, so a relegated club is never matched.
+        return {key: team_name for key, team_name in memo.items() if team_name in self._team_names}
+
+    def _save_memo(self):
+        os.makedirs(os.path.dirname(self._memo_filepath) or '.', exist_ok=True)
+        write_text(text=json.dumps(self._memo, ensure_ascii=False, sort_keys=True), filepath=self._memo_filepath)
+
+    @staticmethod
+    def _backs_short_tokens(key: str, candidate_key: str) -> bool:
+        key_tokens = key.split()
+        candidate_tokens = candidate_key.split()
+        return all(
+            any(other_token[0] == token[0] for other_token in other_tokens)
+            for tokens, other_tokens in [(key_tokens, candidate_tokens), (candidate_tokens, key_tokens)]
+            for token in tokens if len(token) <= 2
+        )
+
+    def _match(self, key: str) -> str or None:
+        # Short tokens like state codes tell apart clubs sharing a name, so each has to match an initial on the other
+        # side, or "Atletico GO" would score high against "Atletico MG".
+        matches = [
+            (candidate_key, score) for candidate_key, score in process.extractBests(
+                key, list(self._index), scorer=fuzz.token_set_ratio, score_cutoff=self._min_score, limit=5
+            )
+            if self._backs_short_tokens(key=key, candidate_key=candidate_key)
+        ]
+
+        # A tie between two different teams (e.g. a bare "United") is left unresolved rather than guessed.
+        if len(matches) == 0 or (
+                len(matches) > 1 and matches[0][1] == matches[1][1] and
+                self._index[matches[0][0]] != self._index[matches[1][0]]
+        ):
+            return None
+        return self._index[matches[0][0]]
+
+    def resolve(self, name: str or None) -> str or None:
+        if name in self._resolved:
+            return self._resolved[name]
+        if not isinstance(name, str):
+            return None
+
+        key = self._normalize(name=name)
+        team_name = self._index.get(key) or self._memo.get(key)
+
+        if team_name is None and len(key) > 0:
+            team_name = self._match(key=key)
+
+            if team_name is not None:
+                print(f'Resolved team name {name} to {team_name}')
+                self._memo[key] = team_name
+                if self._memo_filepath is not None:
+                    self._save_memo()
+
+        self._resolved[name] = team_name
+        return team_name
+
+    def resolve_all(self, names: list) -> list:
+        return [self.resolve(name=name) for name in names]
@@ -1,7 +1,10 @@
 import pandas as pd
 import numpy as np
 import tensorflow.keras.utils as utils
-from infra.converters.team import teams
+from domain.processing.head_to_head import HeadToHeadIndex
+from domain.processing.statistics import StatisticsEngine
+from domain.processing.team_form import TeamForm
+from domain.processing.team_names import TeamNameResolver
 
 def preprocess_training_dataframe(matches_df: pd.DataFrame, one_hot: bool) -> (np.ndarray, np.ndarray):
     inputs = matches_df.dropna().drop(columns=['Season', 'Date', 'Result', 'Home Team', 'Away Team', 'HG', 'AG'])
@@ -20,40 +23,115 @@ def construct_input_from_team_names(
         away_team: str,
         odd_1: float,
         odd_x: float,
-        odd_2: float
+        odd_2: float,
+        head_to_head_index: HeadToHeadIndex or None = None,
+        team_name_resolver: TeamNameResolver or None = None
 ) -> np.ndarray:
-    formatted_home_team = teams.get(home_team)
+    if team_name_resolver is None:
+        team_name_resolver = TeamNameResolver(
+            team_names=pd.unique(matches_df[['Home Team', 'Away Team']].to_numpy().ravel())
+        )
+
+    formatted_home_team, formatted_away_team = _resolve_team_names(
+        team_name_resolver=team_name_resolver, team_names=[home_team, away_team]
+    )
 
     home_team_row = matches_df[matches_df['Home Team'] == formatted_home_team].head(1).drop(
         columns=['Season', 'Date', 'Result', 'Home Team', 'Away Team', 'HG', 'AG']
     )
-
-    formatted_away_team = teams.get(away_team)
     away_team_row = matches_df[matches_df['Away Team'] == formatted_away_team].head(1).drop(
         columns=['Season', 'Date', 'Result', 'Home Team', 'Away Team', 'HG', 'AG']
     )
+    head_to_head_columns = [col for col in home_team_row.columns if col[0] == 'V']
+    if len(head_to_head_columns) > 0:
+        # A saved league has dropped rows, so an index rebuilt from it would miss meetings that training counted.
+        if head_to_head_index is None:
+            raise ValueError(
+                'Head-to-head features need an index built from the full match history, or the league team form'
+            )
+
+        head_to_head_results = dict(zip(StatisticsEngine.HeadToHeadColumns, head_to_head_index.lookup(
+            home_team=formatted_home_team,
+            away_team=formatted_away_team,
+            num_meetings=StatisticsEngine.HeadToHeadMatches
+        )))
+        head_to_head_row = np.float64([head_to_head_results[col] for col in head_to_head_columns])
+    else:
+        head_to_head_row = np.float64([])
+
     return np.hstack((
         np.float64([odd_1, odd_x, odd_2]),
         home_team_row[[col for col in home_team_row.columns if col[0] == 'H']].to_numpy(dtype=np.float64).flatten(),
-        away_team_row[[col for col in home_team_row.columns if col[0] == 'A']].to_numpy(dtype=np.float64).flatten()
+        away_team_row[[col for col in home_team_row.columns if col[0] == 'A']].to_numpy(dtype=np.float64).flatten(),
+        head_to_head_row
     )).reshape((1, -1))
 
 
+def construct_input_from_team_form(
+        team_form: TeamForm,
+        home_team: str,
+        away_team: str,
+        odd_1: float,
+        odd_x: float,
+        odd_2: float,
+        team_name_resolver: TeamNameResolver or None = None
+) -> np.ndarray:
+    if team_name_resolver is None:
+        team_name_resolver = TeamNameResolver(team_names=team_form.teams)
+
+    formatted_home_team, formatted_away_team = _resolve_team_names(
+        team_name_resolver=team_name_resolver, team_names=[home_team, away_team]
+    )
+
+    return np.hstack((
+        np.float64([odd_1, odd_x, odd_2]),
+        team_form.get_home_features(team=formatted_home_team),
+        team_form.get_away_features(team=formatted_away_team),
+        team_form.get_head_to_head_features(home_team=formatted_home_team, away_team=formatted_away_team)
+    )).reshape((1, -1))
+
+
+def _resolve_team_names(team_name_resolver: TeamNameResolver, team_names: list) -> list:
+    formatted_team_names = team_name_resolver.resolve_all(names=team_names)
+    unknown_teams = sorted({
+        str(team_name) for team_name, formatted_team_name in zip(team_names, formatted_team_names)
+        if formatted_team_name is None
+    })
+
+    if len(unknown_teams) > 0:
+        raise ValueError(f'Teams {unknown_teams} have no known league name')
+    return formatted_team_names
+
+
+def construct_inputs_from_team_form(
+        team_form: TeamForm,
+        fixtures_df: pd.DataFrame,
+        team_name_resolver: TeamNameResolver or None = None
+) -> np.ndarray:
+    if team_name_resolver is None:
+        team_name_resolver = TeamNameResolver(team_names=team_form.teams)
+
+    num_matches = fixtures_df.shape[0]
+    team_names = _resolve_team_names(
+        team_name_resolver=team_name_resolver,
+        team_names=fixtures_df['Home Team'].tolist() + fixtures_df['Away Team'].tolist()
+    )
+
+    return team_form.construct_inputs(
+        home_teams=team_names[: num_matches],
+        away_teams=team_names[num_matches:],
+        odds=fixtures_df[['1', 'X', '2']].to_numpy(dtype=np.float64)
+    )
+
+
 def construct_inputs_from_fixtures(
         matches_df: pd.DataFrame,
-        fixtures_df: pd.DataFrame
+        fixtures_df: pd.DataFrame,
+        history_df: pd.DataFrame or None = None
 ) -> np.ndarray:
-    return np.vstack([
-        construct_input_from_team_names(
-            matches_df=matches_df,
-            home_team=match['Home Team'],
-            away_team=match['Away Team'],
-            odd_1=match['1'],
-            odd_x=match['X'],
-            odd_2=match['2']
-        )
-        for _, match in fixtures_df.iterrows()
-    ])
+    return construct_inputs_from_team_form(
+        team_form=TeamForm.build(matches_df=matches_df, history_df=history_df), fixtures_df=fixtures_df
+    )
 
 
 def split_train_targets(
@@ -1,6 +1,7 @@
 from domain.models.model import Model
 from domain.models.tf.nn import FCNet
 import pandas as pd
+from domain.processing.statistics import StatisticsCube
 from domain.tunners.tuner import Tuner
 
 
@@ -9,7 +10,7 @@ class FCNetTuner(Tuner):
             self,
             n_trials: int,
             metric,
-            matches_df: pd.DataFrame,
+            matches_df: pd.DataFrame or None,
             num_eval_samples: int,
             epochs: int,
             early_stopping_epochs: int,
@@ -20,7 +21,8 @@ class FCNetTuner(Tuner):
             min_units: int,
             max_units: int,
             units_increment: int,
-            random_seed: int
+            random_seed: int,
+            statistics_cube: StatisticsCube or None = None
     ):
         super().__init__(
             n_trials=n_trials,
@@ -28,7 +30,8 @@ class FCNetTuner(Tuner):
             matches_df=matches_df,
             one_hot=True,
             num_eval_samples=num_eval_samples,
-            random_seed=random_seed
+            random_seed=random_seed,
+            statistics_cube=statistics_cube
         )
 
         self._epochs = epochs
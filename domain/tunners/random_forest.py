@@ -1,5 +1,6 @@
 import pandas as pd
 from domain.models.scikit.rf import RandomForest
+from domain.processing.statistics import StatisticsCube
 from domain.tunners.tuner import Tuner
 
 
@@ -8,9 +9,10 @@ class RandomForestTuner(Tuner):
             self,
             n_trials: int,
             metric,
-            matches_df: pd.DataFrame,
+            matches_df: pd.DataFrame or None,
             num_eval_samples: int,
-            random_seed: int = 0
+            random_seed: int = 0,
+            statistics_cube: StatisticsCube or None = None
     ):
         super().__init__(
             n_trials=n_trials,
@@ -18,7 +20,8 @@ class RandomForestTuner(Tuner):
             matches_df=matches_df,
             one_hot=False,
             num_eval_samples=num_eval_samples,
-            random_seed=random_seed
+            random_seed=random_seed,
+            statistics_cube=statistics_cube
         )
 
     def _create_model(self, trial) -> RandomForest:
@@ -2,6 +2,7 @@ import numpy as np
 import optuna
 import pandas as pd
 from abc import ABC, abstractmethod
+from domain.processing.statistics import StatisticsCube
 from domain.processing.training import preprocess_training_dataframe, split_train_targets
 from domain.models.model import Model
 
@@ -11,19 +12,28 @@ class Tuner(ABC):
             self,
             n_trials: int,
             metric,
-            matches_df: pd.DataFrame,
+            matches_df: pd.DataFrame or None,
             one_hot: bool,
             num_eval_samples: int,
-            random_seed: int = 0
+            random_seed: int = 0,
+            statistics_cube: StatisticsCube or None = None
     ):
         self._n_trials = n_trials
         self._metric = metric
         self._random_seed = random_seed
         self._one_hot = one_hot
+        self._num_eval_samples = num_eval_samples
+        self._statistics_cube = statistics_cube
 
-        inputs, targets = preprocess_training_dataframe(matches_df=matches_df, one_hot=one_hot)
+        if statistics_cube is None:
+            self._split_matches(matches_df=matches_df)
+        else:
+            self._split_matches(matches_df=statistics_cube.get_by_id(parameters_id=0))
+
+    def _split_matches(self, matches_df: pd.DataFrame):
+        inputs, targets = preprocess_training_dataframe(matches_df=matches_df, one_hot=self._one_hot)
         self._x_train, self._y_train, self._x_test, self._y_test = split_train_targets(
-            inputs=inputs, targets=targets, num_eval_samples=num_eval_samples
+            inputs=inputs, targets=targets, num_eval_samples=self._num_eval_samples
         )
 
     @property
@@ -55,6 +65,13 @@ class Tuner(ABC):
         pass
 
     def _objective(self, trial) -> float:
+        # With a statistics cube, the window size and goal diff margin are tuned like any other hyperparameter.
+        if self._statistics_cube is not None:
+            parameters_id = trial.suggest_categorical(
+                'statistics_parameters_id', list(range(len(self._statistics_cube)))
+            )
+            self._split_matches(matches_df=self._statistics_cube.get_by_id(parameters_id=parameters_id))
+
         model = self._create_model(trial=trial)
         use_over_sampling = bool(trial.suggest_categorical('user_over_sampling', [True, False]))
 
@@ -72,4 +89,10 @@ class Tuner(ABC):
         study = optuna.create_study(direction='maximize')
         study.optimize(self._objective, n_trials=self._n_trials)
         best_params = study.best_trial.params
+
+        if self._statistics_cube is not None:
+            parameters_id = best_params.pop('statistics_parameters_id')
+            self._split_matches(matches_df=self._statistics_cube.get_by_id(parameters_id=parameters_id))
+            best_params['last_n_matches'], best_params['goal_diff_margin'] = \
+                self._statistics_cube.parameters[parameters_id]
         return best_params
@@ -0,0 +1,63 @@
+import numpy as np
+
+from domain.models.ensemble import get_ensemble_predictions
+from infra.repositories.model import ModelRepository
+
+
+class BatchMatchesAnalyseInput(object):
+    def __init__(
+            self,
+            league_name: str,
+            x: np.ndarray
+    ):
+        self.league_name = league_name
+        self.x = x
+
+
+class BatchMatchesAnalyseUseCase(object):
+    ResultNames = ['H', 'D', 'A']
+
+    def __init__(self, model_repository: ModelRepository):
+        self.__model_repository = model_repository
+
+    def __load_model(self, league_name: str, model_name: str, input_shape: tuple):
+        return self.__model_repository.load_model(
+            league_name=league_name, model_name=model_name, input_shape=input_shape, random_seed=0
+        )
+
+    def execute(self, input: BatchMatchesAnalyseInput) -> list:
+        input_shape = input.x.shape[1:]
+        models = {
+            'nn': self.__load_model(league_name=input.league_name, model_name='nn', input_shape=input_shape),
+            'rf': self.__load_model(league_name=input.league_name, model_name='rf.pickle', input_shape=input_shape)
+        }
+        nn_pred, _ = models['nn'].predict(x=input.x)
+        rf_pred, rf_proba = models['rf'].predict(x=input.x)
+
+        # Where both models agree the random forest prediction is kept, otherwise all the league models vote.
+        y_pred, predict_proba = rf_pred.copy(), np.array(rf_proba, dtype=np.float64)
+        disagree = nn_pred != rf_pred
+
+        if disagree.any():
+            model_names = self.__model_repository.get_all_models(league_name=input.league_name)
+            for model_name in model_names:
+                if model_name not in models:
+                    models[model_name] = self.__load_model(
+                        league_name=input.league_name, model_name=model_name, input_shape=input_shape
+                    )
+
+            ensemble_models = [models[model_name] for model_name in model_names]
+            ensemble_pred, ensemble_proba = get_ensemble_predictions(x=input.x[disagree], models=ensemble_models)
+            y_pred[disagree] = ensemble_pred
+            predict_proba[disagree] = ensemble_proba
+
+        predict_proba = np.round(predict_proba, 2)
+        return [
+            {
+                "predict": self.ResultNames[predicted],
+                "home_percentage": proba[0],
+                "draw_percentage": proba[1],
+                "away_percentage": proba[2]
+            }
+            for predicted, proba in zip(y_pred, predict_proba)
+        ]
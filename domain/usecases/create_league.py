@@ -1,3 +1,4 @@
+from domain.processing.statistics import StatisticsEngine
 from infra.repositories.league import LeagueRepository
 
 
@@ -8,13 +9,19 @@ class CreateLeagueInput(object):
             official_league_name: str,
             custom_league_name: str,
             last_n_matches: int,
-            goal_diff_margin: int
+            goal_diff_margin: int,
+            include_form_columns: bool = False,
+            form_decay_factor: float = StatisticsEngine.DefaultFormDecayFactor,
+            include_head_to_head_columns: bool = False
     ):
         self.country = country
         self.official_league_name = official_league_name
         self.custom_league_name = custom_league_name
         self.last_n_matches = last_n_matches
         self.goal_diff_margin = goal_diff_margin
+        self.include_form_columns = include_form_columns
+        self.form_decay_factor = form_decay_factor
+        self.include_head_to_head_columns = include_head_to_head_columns
 
 
 class CreateLeagueUseCase(object):
@@ -22,9 +29,13 @@ class CreateLeagueUseCase(object):
         self.__league_repository = league_repository
 
     def execute(self, input: CreateLeagueInput, ):
-        columns = self.__get_columns()
+        columns = self.__get_columns(
+            include_form_columns=input.include_form_columns,
+            include_head_to_head_columns=input.include_head_to_head_columns
+        )
         selected_home_columns = [col for i, col in enumerate(columns.get('home_columns'))]
         selected_away_columns = [col for i, col in enumerate(columns.get('away_columns'))]
+        selected_head_to_head_columns = [col for i, col in enumerate(columns.get('head_to_head_columns'))]
 
         all_leagues = self.__league_repository.get_all_available_leagues()
 
@@ -32,19 +43,26 @@ class CreateLeagueUseCase(object):
             league=all_leagues[(input.country, input.official_league_name)],
             last_n_matches=input.last_n_matches,
             goal_diff_margin=input.goal_diff_margin,
-            statistic_columns=selected_home_columns + selected_away_columns,
-            league_name=input.custom_league_name
+            statistic_columns=selected_home_columns + selected_away_columns + selected_head_to_head_columns,
+            league_name=input.custom_league_name,
+            form_decay_factor=input.form_decay_factor
         )
 
         return input.custom_league_name, league, matches_df
 
-    def __get_columns(self):
+    def __get_columns(self, include_form_columns: bool, include_head_to_head_columns: bool):
         all_columns = self.__league_repository.get_all_available_columns()
 
+        if include_form_columns:
+            all_columns = all_columns + self.__league_repository.get_all_form_columns()
+
         home_columns = [col for col in all_columns if col[0] == 'H']
         away_columns = [col for col in all_columns if col[0] == 'A']
+        head_to_head_columns = self.__league_repository.get_all_head_to_head_columns() \
+            if include_head_to_head_columns else []
 
         return {
             'home_columns': home_columns,
-            'away_columns': away_columns
+            'away_columns': away_columns,
+            'head_to_head_columns': head_to_head_columns
         }
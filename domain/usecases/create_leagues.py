@@ -0,0 +1,56 @@
+from infra.repositories.league import LeagueRepository
+
+
+class CreateLeaguesInput(object):
+    def __init__(
+            self,
+            league_keys: list,
+            last_n_matches: int,
+            goal_diff_margin: int,
+            num_workers: int or None = None,
+            custom_league_names: dict or None = None
+    ):
+        self.league_keys = league_keys
+        self.custom_league_names = {} if custom_league_names is None else custom_league_names
+        self.last_n_matches = last_n_matches
+        self.goal_diff_margin = goal_diff_margin
+        self.num_workers = num_workers
+
+
+class CreateLeaguesUseCase(object):
+    def __init__(self, league_repository: LeagueRepository):
+        self.__league_repository = league_repository
+
+    def execute(self, input: CreateLeaguesInput) -> dict:
+        leagues = []
+        league_names = []
+        results = {}
+
+        for country, official_league_name in input.league_keys:
+            # Leagues are saved under the name the jobs load them by, e.g. Brasileirão for Brazil Serie-A.
+            league_name = input.custom_league_names.get(
+                (country, official_league_name),
+                self.get_league_name(country=country, official_league_name=official_league_name)
+            )
+
+            league = self.__league_repository.get_available_league(country=country, name=official_league_name)
+
+            if league is not None:
+                leagues.append(league)
+                league_names.append(league_name)
+            else:
+                results[league_name] = {'success': False, 'num_matches': None, 'error': 'League is not available'}
+
+        results.update(self.__league_repository.create_leagues(
+            leagues=leagues,
+            league_names=league_names,
+            last_n_matches=input.last_n_matches,
+            goal_diff_margin=input.goal_diff_margin,
+            statistic_columns=self.__league_repository.get_all_available_columns(),
+            num_workers=input.num_workers
+        ))
+        return results
+
+    @staticmethod
+    def get_league_name(country: str, official_league_name: str) -> str:
+        return f'{country}-{official_league_name}'
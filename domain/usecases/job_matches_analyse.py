@@ -1,111 +1,252 @@
-from datetime import datetime
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 import pandas as pd
 
-from domain.usecases.load_league import LoadLeagueUseCase, LoadLeagueInput
-from domain.usecases.matches_analyse import MatchesAnalyseUseCase, MatchesAnalyseInput
-from infra.clients.footystats.footystats import FootystatsClient
+from domain.processing.team_names import TeamNameResolver
+from domain.processing.training import construct_inputs_from_team_form
+from domain.usecases.batch_matches_analyse import BatchMatchesAnalyseUseCase, BatchMatchesAnalyseInput
+from domain.usecases.load_league import LoadLeagueInput
+from domain.usecases.load_team_form import LoadTeamFormUseCase
+from infra.clients.footystats.footystats import AsyncFootystatsClient, FootystatsClient
+from infra.repositories.fixtures import FixturesRepository
 from infra.repositories.league import LeagueRepository
 from infra.repositories.model import ModelRepository
 
 
 class JobMatchesAnalyseUseCase:
-    def __init__(self, model_repository: ModelRepository, league_repository: LeagueRepository):
-        self.__client = FootystatsClient()
-        self.__matches_analyse_use_case = MatchesAnalyseUseCase(model_repository=model_repository)
-        self.__leagues = self.__client.get_league_info()
-        self.__load_league_use_case = LoadLeagueUseCase(league_repository=league_repository)
-
-    def execute(self):
-        predicts = dict()
-        leagues_to_analyze = [
-            ("Brasileirão", "Brazil Serie A"),
-            ("Premier-League", "England Premier League")
-        ]
-
-        for league_name, external_league_name in leagues_to_analyze:
-            matches = self.__client.get_today_matches()
-            league_predicts = self.__get_predicts(league_name, external_league_name, matches)
-
-            if league_predicts:
-                predicts[league_name] = league_predicts
+    LeagueMaxAge = timedelta(hours=12)
+    LeaguesToAnalyze = [
+        ("Brasileirão", "Brazil Serie A"),
+        ("Premier-League", "England Premier League")
+    ]
+    Stages = ['fetch_fixtures', 'resolve_teams', 'build_inputs', 'predict']
 
+    def __init__(
+            self,
+            model_repository: ModelRepository,
+            league_repository: LeagueRepository,
+            footystats_client: FootystatsClient or None = None,
+            fixtures_directory: str or None = None,
+            team_names_directory: str or None = None,
+            team_concurrency: int = 8,
+            input_workers: int = 2,
+            predict_workers: int = 1,
+            queue_size: int = 2
+    ):
+        self.__client = FootystatsClient() if footystats_client is None else footystats_client
+        self.__fixtures_repository = FixturesRepository(
+            footystats_client=self.__client, fixtures_directory=fixtures_directory
+        )
+        self.__batch_matches_analyse_use_case = BatchMatchesAnalyseUseCase(model_repository=model_repository)
+        self.__load_team_form_use_case = LoadTeamFormUseCase(league_repository=league_repository)
+        self.__team_names_directory = team_names_directory
+        self.__team_concurrency = team_concurrency
+        self.__input_workers = input_workers
+        self.__predict_workers = predict_workers
+        self.__queue_size = queue_size
+        self.__stage_timings = {}
+
+    @property
+    def stage_timings(self) -> dict:
+        return self.__stage_timings
+
+    def execute(self) -> dict:
+        predicts, self.__stage_timings = asyncio.run(self.__run_pipeline())
         self.__save_predicts(predicts=predicts)
 
         return predicts
 
-    def __get_predicts(self, league_name: str, external_league_name: str, matches: list):
-        league_id = self.__get_current_season_id(external_league_name)
-        load_league_input = LoadLeagueInput(league_name=league_name)
-        matches_df = self.__load_league_use_case.execute(input=load_league_input)
+    async def __run_pipeline(self) -> (dict, dict):
+        start = time.perf_counter()
+        stage_timings = {stage: 0.0 for stage in self.Stages}
+        league_predicts = {}
+        async_client = AsyncFootystatsClient(client=self.__client, max_concurrency=self.__team_concurrency)
+        fixtures_queue = asyncio.Queue(maxsize=self.__queue_size)
+        teams_queue = asyncio.Queue(maxsize=self.__queue_size)
+        inputs_queue = asyncio.Queue(maxsize=self.__queue_size)
 
-        league_predicts = []
+        with ThreadPoolExecutor(max_workers=self.__predict_workers) as predict_executor:
+            async def predict(item: dict):
+                league_predicts[item['league_name']] = await asyncio.get_running_loop().run_in_executor(
+                    predict_executor, self.__predict, item
+                )
 
-        for m in matches:
-            if m.get('competition_id') == league_id:
-                home_team_info = self.__client.get_team_info(team_id=m.get('homeID'))[0]
-                away_team_info = self.__client.get_team_info(team_id=m.get('awayID'))[0]
-                game_date = datetime.fromtimestamp(m.get('date_unix'))
-                game_time_formatted = game_date.strftime("%H:%M")
-
-                predict = self.__get_match_predict(matches_df, home_team_info, away_team_info, m, league_name)
-
-                final_predict = {
-                    "league": league_name,
-                    "round": m.get('game_week'),
-                    "home_team": str(home_team_info.get('name')).upper(),
-                    "away_team": str(away_team_info.get('name')).upper(),
-                    "time": game_time_formatted,
-                    "predict": predict.get('predict'),
-                    "home_percentage": predict.get("home_percentage"),
-                    "draw_percentage": predict.get("draw_percentage"),
-                    "away_percentage": predict.get("away_percentage")
-                }
-
-                league_predicts.append(final_predict)
+            await asyncio.gather(
+                self.__run_stage(
+                    stage='fetch_fixtures',
+                    worker_fn=lambda _: self.__fetch_fixtures(output_queue=fixtures_queue),
+                    input_queue=None,
+                    output_queue=fixtures_queue,
+                    num_workers=1,
+                    stage_timings=stage_timings
+                ),
+                self.__run_stage(
+                    stage='resolve_teams',
+                    worker_fn=lambda item: self.__resolve_teams(item=item, async_client=async_client),
+                    input_queue=fixtures_queue,
+                    output_queue=teams_queue,
+                    num_workers=len(self.LeaguesToAnalyze),
+                    stage_timings=stage_timings
+                ),
+                self.__run_stage(
+                    stage='build_inputs',
+                    worker_fn=lambda item: asyncio.to_thread(self.__build_inputs, item),
+                    input_queue=teams_queue,
+                    output_queue=inputs_queue,
+                    num_workers=self.__input_workers,
+                    stage_timings=stage_timings
+                ),
+                self.__run_stage(
+                    stage='predict',
+                    worker_fn=predict,
+                    input_queue=inputs_queue,
+                    output_queue=None,
+                    num_workers=self.__predict_workers,
+                    stage_timings=stage_timings
+                )
+            )
 
-        return league_predicts
+        stage_timings['total'] = time.perf_counter() - start
+        predicts = {
+            league_name: league_predicts[league_name]
+            for league_name, _ in self.LeaguesToAnalyze
+            if league_predicts.get(league_name)
+        }
+        return predicts, stage_timings
 
-    def __get_match_predict(self, matches_df, home_team_info, away_team_info, match_data, league_name):
-        model_names = ["nn", "rf.pickle"]
-        predict = None
-
-        for model_name in model_names:
-            predict_input = MatchesAnalyseInput(
-                matches_df=matches_df,
-                home_team=home_team_info.get('name'),
-                away_team=away_team_info.get('name'),
-                odd_1=match_data.get('odds_ft_1'),
-                odd_x=match_data.get('odds_ft_x'),
-                odd_2=match_data.get('odds_ft_2'),
-                league_name=league_name,
-                model_name=model_name
-            )
+    @staticmethod
+    async def __run_stage(
+            stage: str,
+            worker_fn,
+            input_queue: asyncio.Queue or None,
+            output_queue: asyncio.Queue or None,
+            num_workers: int,
+            stage_timings: dict
+    ):
+        # Workers of a stage overlap, so its wall-clock time spans from the first item started to the last finished.
+        stage_span = {'start': None, 'end': None}
 
-            predict_result = self.__matches_analyse_use_case.execute(input=predict_input)
+        async def worker():
+            while True:
+                item = None if input_queue is None else await input_queue.get()
 
-            if predict is None:
-                predict = predict_result
+                # The end-of-stream marker is put back for the sibling workers of this stage.
+                if input_queue is not None and item is None:
+                    await input_queue.put(None)
+                    return
 
-            elif predict_result.get('predict') == predict.get('predict'):
-                return predict_result
+                if stage_span['start'] is None:
+                    stage_span['start'] = time.perf_counter()
 
-            else:
-                en_predict_input = MatchesAnalyseInput(
-                    matches_df=matches_df,
-                    home_team=home_team_info.get('name'),
-                    away_team=away_team_info.get('name'),
-                    odd_1=match_data.get('odds_ft_1'),
-                    odd_x=match_data.get('odds_ft_x'),
-                    odd_2=match_data.get('odds_ft_2'),
-                    league_name=league_name,
-                    model_name="Ensemble"
+                try:
+                    result = await worker_fn(item)
+                except Exception as error:
+                    # A failing league is dropped here, so it does not cancel the others through gather.
+                    league_name = '' if item is None else f' for {item["league_name"]}'
+                    print(f'Stage {stage} failed{league_name}: {error!r}')
+                    result = None
+                stage_span['end'] = time.perf_counter()
+
+                if output_queue is not None and result is not None:
+                    await output_queue.put(result)
+                if input_queue is None:
+                    return
+
+        await asyncio.gather(*[worker() for _ in range(num_workers)])
+        if stage_span['start'] is not None:
+            stage_timings[stage] = stage_span['end'] - stage_span['start']
+
+        if output_queue is not None:
+            await output_queue.put(None)
+
+    async def __fetch_fixtures(self, output_queue: asyncio.Queue):
+        leagues, fixtures = await asyncio.gather(
+            asyncio.to_thread(self.__client.get_league_info),
+            asyncio.to_thread(self.__fixtures_repository.get_fixtures_by_competition)
+        )
+
+        for league_name, external_league_name in self.LeaguesToAnalyze:
+            league_id = self.__get_current_season_id(leagues=leagues, external_league_name=external_league_name)
+
+            if len(fixtures.get(league_id, [])) > 0:
+                await output_queue.put(
+                    {'league_name': league_name, 'league_id': league_id, 'fixtures': fixtures[league_id]}
                 )
 
-                return self.__matches_analyse_use_case.execute(input=en_predict_input)
+    @staticmethod
+    async def __resolve_teams(item: dict, async_client: AsyncFootystatsClient) -> dict:
+        await async_client.warm_up_teams(season_id=item['league_id'])
+
+        team_ids = sorted({match.get(key) for match in item['fixtures'] for key in ['homeID', 'awayID']})
+        team_infos = await asyncio.gather(*[async_client.get_team_info(team_id=team_id) for team_id in team_ids])
+        item['team_names'] = {team_id: team_info[0].get('name') for team_id, team_info in zip(team_ids, team_infos)}
+        return item
+
+    def __build_inputs(self, item: dict) -> dict or None:
+        team_form = self.__load_team_form_use_case.execute(
+            input=LoadLeagueInput(league_name=item['league_name'], max_age=self.LeagueMaxAge)
+        )
+        team_name_resolver = TeamNameResolver.for_league(
+            team_names=team_form.teams,
+            league_name=item['league_name'],
+            team_names_directory=self.__team_names_directory
+        )
+        fixtures = []
+
+        for m in item['fixtures']:
+            home_team = item['team_names'][m.get('homeID')]
+            away_team = item['team_names'][m.get('awayID')]
+
+            if team_name_resolver.resolve(name=home_team) is not None and \
+                    team_name_resolver.resolve(name=away_team) is not None:
+                fixtures.append(m)
+            else:
+                print(f'Skipping {home_team} x {away_team}: team not found in league {item["league_name"]}')
+
+        if len(fixtures) == 0:
+            return None
+
+        fixtures_df = pd.DataFrame({
+            'Home Team': [item['team_names'][m.get('homeID')] for m in fixtures],
+            'Away Team': [item['team_names'][m.get('awayID')] for m in fixtures],
+            '1': [m.get('odds_ft_1') for m in fixtures],
+            'X': [m.get('odds_ft_x') for m in fixtures],
+            '2': [m.get('odds_ft_2') for m in fixtures]
+        })
+        item['fixtures'] = fixtures
+        item['x'] = construct_inputs_from_team_form(
+            team_form=team_form, fixtures_df=fixtures_df, team_name_resolver=team_name_resolver
+        )
+        return item
+
+    def __predict(self, item: dict) -> list:
+        predicts = self.__batch_matches_analyse_use_case.execute(
+            input=BatchMatchesAnalyseInput(league_name=item['league_name'], x=item['x'])
+        )
+        league_predicts = []
+
+        for m, predict in zip(item['fixtures'], predicts):
+            game_date = datetime.fromtimestamp(m.get('date_unix'))
+
+            league_predicts.append({
+                "league": item['league_name'],
+                "round": m.get('game_week'),
+                "home_team": str(item['team_names'][m.get('homeID')]).upper(),
+                "away_team": str(item['team_names'][m.get('awayID')]).upper(),
+                "time": game_date.strftime("%H:%M"),
+                "predict": predict.get('predict'),
+                "home_percentage": predict.get("home_percentage"),
+                "draw_percentage": predict.get("draw_percentage"),
+                "away_percentage": predict.get("away_percentage")
+            })
+        return league_predicts
 
-    def __get_current_season_id(self, external_league_name: str):
-        for league in self.__leagues:
+    @staticmethod
+    def __get_current_season_id(leagues: list, external_league_name: str):
+        for league in leagues:
             if league.get('name') == external_league_name:
                 seasons = league.get('season')
                 return seasons[-1].get('id')
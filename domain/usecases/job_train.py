@@ -5,19 +5,36 @@ from domain.usecases.job_matches_analyse import JobMatchesAnalyseUseCase
 from domain.usecases.load_league import LoadLeagueUseCase, LoadLeagueInput
 from domain.usecases.neural_network import NeuralNetworkUseCase, NeuralNetworkInput
 from domain.usecases.random_forest import RandomForestUseCase, RandomForestInput
+from domain.usecases.statistics_parameters import StatisticsParametersUseCase, StatisticsParametersInput
+from infra.clients.footystats.footystats import FootystatsClient
 from infra.repositories.league import LeagueRepository
 from infra.repositories.model import ModelRepository
 
 
 class JobTrainUseCase(object):
-    def __init__(self, league_repository: LeagueRepository, model_repository: ModelRepository):
+    def __init__(
+            self,
+            league_repository: LeagueRepository,
+            model_repository: ModelRepository,
+            footystats_client: FootystatsClient or None = None,
+            fixtures_directory: str or None = None,
+            team_names_directory: str or None = None,
+            last_n_matches_list: list or None = None,
+            goal_diff_margins: list or None = None
+    ):
         self.__league_repository = league_repository
+        self.__last_n_matches_list = last_n_matches_list
+        self.__goal_diff_margins = goal_diff_margins
+        self.__statistics_parameters_use_case = StatisticsParametersUseCase(league_repository=league_repository)
         self.__create_league_use_case = CreateLeagueUseCase(league_repository=league_repository)
         self.__load_league_use_case = LoadLeagueUseCase(league_repository=league_repository)
         self.__neural_network_use_case = NeuralNetworkUseCase(model_repository=model_repository)
         self.__random_forest_use_case = RandomForestUseCase(model_repository=model_repository)
         self.__job_matches_analyse = JobMatchesAnalyseUseCase(league_repository=league_repository,
-                                                              model_repository=model_repository)
+                                                              model_repository=model_repository,
+                                                              footystats_client=footystats_client,
+                                                              fixtures_directory=fixtures_directory,
+                                                              team_names_directory=team_names_directory)
 
     def execute(self, country: str):
         self.__delete_predicts()
@@ -63,6 +80,14 @@ class JobTrainUseCase(object):
         else:
             matches_df = create_league_result[2]
 
+        if self.__last_n_matches_list is not None and self.__goal_diff_margins is not None:
+            print(f"Tuning statistics parameters for league {custom_league_name}")
+            matches_df = self.__statistics_parameters_use_case.execute(input=StatisticsParametersInput(
+                league_name=custom_league_name,
+                last_n_matches_list=self.__last_n_matches_list,
+                goal_diff_margins=self.__goal_diff_margins
+            ))
+
         self.__train_neural_network(custom_league_name, matches_df)
         self.__train_random_forest(custom_league_name, matches_df)
 
@@ -1,20 +1,53 @@
+from datetime import date, datetime, timedelta
+
 from infra.repositories.league import LeagueRepository
 
 
 class LoadLeagueInput(object):
     def __init__(
             self,
-            league_name: str
+            league_name: str,
+            force_refresh: bool = False,
+            max_age: timedelta or None = None,
+            last_completed_matchday: date or None = None
     ):
         self.league_name = league_name
+        self.force_refresh = force_refresh
+        self.max_age = max_age
+        self.last_completed_matchday = last_completed_matchday
 
 
 class LoadLeagueUseCase(object):
     def __init__(self, league_repository: LeagueRepository):
         self.__league_repository = league_repository
 
-    def execute(self, input: LoadLeagueInput):
+    def __is_fresh(self, input: LoadLeagueInput) -> bool:
+        if input.force_refresh or (input.max_age is None and input.last_completed_matchday is None):
+            return False
+
+        if input.max_age is not None:
+            updated_at = self.__league_repository.get_league_updated_at(league_name=input.league_name)
+
+            if updated_at is None or datetime.now() - updated_at > input.max_age:
+                return False
+
+        if input.last_completed_matchday is not None:
+            latest_match_date = self.__league_repository.get_latest_match_date(league_name=input.league_name)
+
+            if latest_match_date is None or latest_match_date.date() < input.last_completed_matchday:
+                return False
+
+        return True
+
+    def refresh(self, input: LoadLeagueInput):
+        if self.__is_fresh(input=input):
+            return None
+
         matches_df, league = self.__league_repository.update_league(league_name=input.league_name)
+        return matches_df
+
+    def execute(self, input: LoadLeagueInput):
+        matches_df = self.refresh(input=input)
 
         if matches_df is None:
             matches_df, league = self.__league_repository.load_league(league_name=input.league_name)
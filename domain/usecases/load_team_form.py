@@ -0,0 +1,12 @@
+from domain.usecases.load_league import LoadLeagueUseCase, LoadLeagueInput
+from infra.repositories.league import LeagueRepository
+
+
+class LoadTeamFormUseCase(object):
+    def __init__(self, league_repository: LeagueRepository):
+        self.__league_repository = league_repository
+        self.__load_league_use_case = LoadLeagueUseCase(league_repository=league_repository)
+
+    def execute(self, input: LoadLeagueInput):
+        self.__load_league_use_case.refresh(input=input)
+        return self.__league_repository.load_team_form(league_name=input.league_name)
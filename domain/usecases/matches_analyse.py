@@ -2,6 +2,9 @@ from datetime import datetime
 
 import pandas as pd
 
+from domain.processing.head_to_head import HeadToHeadIndex
+from domain.processing.team_form import TeamForm
+from domain.processing.team_names import TeamNameResolver
 from domain.usecases.predict import PredictUseCase, PredictInput
 from infra.repositories.model import ModelRepository
 
@@ -10,13 +13,16 @@ class MatchesAnalyseInput(object):
     def __init__(
             self,
             league_name: str,
-            matches_df: pd.DataFrame,
+            matches_df: pd.DataFrame or None,
             home_team: str,
             away_team: str,
             odd_1: float,
             odd_x: float,
             odd_2: float,
-            model_name: str
+            model_name: str,
+            head_to_head_index: HeadToHeadIndex or None = None,
+            team_form: TeamForm or None = None,
+            team_name_resolver: TeamNameResolver or None = None
     ):
         self.league_name = league_name
         self.matches_df = matches_df
@@ -26,6 +32,9 @@ class MatchesAnalyseInput(object):
         self.odd_x = odd_x
         self.odd_2 = odd_2
         self.model_name = model_name
+        self.head_to_head_index = head_to_head_index
+        self.team_form = team_form
+        self.team_name_resolver = team_name_resolver
 
 
 class MatchesAnalyseUseCase(object):
@@ -41,7 +50,10 @@ class MatchesAnalyseUseCase(object):
             odd_x=input.odd_x,
             odd_2=input.odd_2,
             model_name=input.model_name,
-            league_name=input.league_name
+            league_name=input.league_name,
+            head_to_head_index=input.head_to_head_index,
+            team_form=input.team_form,
+            team_name_resolver=input.team_name_resolver
         )
         predicted = self.__predict_use_case.execute(input=predict_input)
 
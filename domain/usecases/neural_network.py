@@ -14,7 +14,7 @@ class NeuralNetworkInput(object):
     def __init__(
             self,
             league_name: str,
-            matches_df: pd.DataFrame,
+            matches_df: pd.DataFrame or None,
             metric_name: str = 'Accuracy',
             n_trials: int = 100,
             num_eval_samples: int = 50,
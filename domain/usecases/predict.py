@@ -2,21 +2,27 @@ import numpy as np
 import pandas as pd
 
 from domain.models.ensemble import get_ensemble_predictions
-from domain.processing.training import construct_input_from_team_names
+from domain.processing.head_to_head import HeadToHeadIndex
+from domain.processing.team_form import TeamForm
+from domain.processing.team_names import TeamNameResolver
+from domain.processing.training import construct_input_from_team_form, construct_input_from_team_names
 from infra.repositories.model import ModelRepository
 
 
 class PredictInput(object):
     def __init__(
             self,
-            matches_df: pd.DataFrame,
+            matches_df: pd.DataFrame or None,
             home_team: str,
             away_team: str,
             odd_1: float,
             odd_x: float,
             odd_2: float,
             model_name: str,
-            league_name: str
+            league_name: str,
+            head_to_head_index: HeadToHeadIndex or None = None,
+            team_form: TeamForm or None = None,
+            team_name_resolver: TeamNameResolver or None = None
     ):
         self.matches_df = matches_df
         self.home_team = home_team
@@ -26,6 +32,9 @@ class PredictInput(object):
         self.odd_2 = odd_2
         self.model_name = model_name
         self.league_name = league_name
+        self.head_to_head_index = head_to_head_index
+        self.team_form = team_form
+        self.team_name_resolver = team_name_resolver
 
 
 class PredictUseCase(object):
@@ -33,14 +42,27 @@ class PredictUseCase(object):
         self.__model_repository = model_repository
 
     def execute(self, input: PredictInput):
-        x = construct_input_from_team_names(
-            matches_df=input.matches_df,
-            home_team=input.home_team,
-            away_team=input.away_team,
-            odd_1=input.odd_1,
-            odd_x=input.odd_x,
-            odd_2=input.odd_2
-        )
+        if input.team_form is not None:
+            x = construct_input_from_team_form(
+                team_form=input.team_form,
+                home_team=input.home_team,
+                away_team=input.away_team,
+                odd_1=input.odd_1,
+                odd_x=input.odd_x,
+                odd_2=input.odd_2,
+                team_name_resolver=input.team_name_resolver
+            )
+        else:
+            x = construct_input_from_team_names(
+                matches_df=input.matches_df,
+                home_team=input.home_team,
+                away_team=input.away_team,
+                odd_1=input.odd_1,
+                odd_x=input.odd_x,
+                odd_2=input.odd_2,
+                head_to_head_index=input.head_to_head_index,
+                team_name_resolver=input.team_name_resolver
+            )
 
         if input.model_name == 'Ensemble':
             models = [
@@ -13,12 +13,12 @@ class RandomForestInput(object):
     def __init__(
             self,
             league_name: str,
-            matches_df: pd.DataFrame,
+            matches_df: pd.DataFrame or None,
             metric_name: str = 'Accuracy',
             n_trials: int = 100,
             num_eval_samples: int = 50,
             random_seed: int = 0,
-            metric_target: str = 'Home',
+            metric_target: str = 'Home'
     ):
         self.league_name = league_name
         self.matches_df = matches_df
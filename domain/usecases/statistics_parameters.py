@@ -0,0 +1,58 @@
+import pandas as pd
+from sklearn.metrics import accuracy_score
+
+from domain.tunners.random_forest import RandomForestTuner
+from infra.repositories.league import LeagueRepository
+
+
+class StatisticsParametersInput(object):
+    def __init__(
+            self,
+            league_name: str,
+            last_n_matches_list: list,
+            goal_diff_margins: list,
+            n_trials: int = 30,
+            num_eval_samples: int = 50,
+            random_seed: int = 0
+    ):
+        self.league_name = league_name
+        self.last_n_matches_list = last_n_matches_list
+        self.goal_diff_margins = goal_diff_margins
+        self.n_trials = n_trials
+        self.num_eval_samples = num_eval_samples
+        self.random_seed = random_seed
+
+
+class StatisticsParametersUseCase(object):
+    def __init__(self, league_repository: LeagueRepository):
+        self.__league_repository = league_repository
+
+    def execute(self, input: StatisticsParametersInput) -> pd.DataFrame or None:
+        statistics_cube = self.__league_repository.compute_statistics_cube(
+            league_name=input.league_name,
+            last_n_matches_list=input.last_n_matches_list,
+            goal_diff_margins=input.goal_diff_margins
+        )
+
+        if statistics_cube is None:
+            return None
+
+        # The pair is chosen once per league, so every model of its ensemble is trained on the stored features.
+        best_params = RandomForestTuner(
+            n_trials=input.n_trials,
+            metric=lambda y_true, y_pred: accuracy_score(y_true=y_true, y_pred=y_pred),
+            matches_df=None,
+            num_eval_samples=input.num_eval_samples,
+            random_seed=input.random_seed,
+            statistics_cube=statistics_cube
+        ).tune()
+        print(
+            f'League {input.league_name}: last_n_matches = {best_params["last_n_matches"]}, '
+            f'goal_diff_margin = {best_params["goal_diff_margin"]}'
+        )
+
+        return self.__league_repository.update_statistics_parameters(
+            league_name=input.league_name,
+            last_n_matches=best_params['last_n_matches'],
+            goal_diff_margin=best_params['goal_diff_margin']
+        )
@@ -1,16 +1,183 @@
+import io
+import os
+import time
 import pandas as pd
+import requests
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+from requests.adapters import HTTPAdapter
+from infra.clients.footballdata.cache import RawDataCache
 from infra.repositories.entities.league import League
 
 
+class SeasonNotPublishedError(Exception):
+    pass
+
+
+class SeasonDownloadError(Exception):
+    pass
+
+
+def create_session(max_connections: int = 8) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class FootballDataAPI(ABC):
+    TransientStatusCodes = {408, 429, 500, 502, 503, 504}
+    SourceColumns = None
+
+    def __init__(
+            self,
+            max_workers: int = 8,
+            max_retries: int = 3,
+            retry_backoff_seconds: float = 1.0,
+            timeout: tuple = (5, 30),
+            raw_data_directory: str or None = None,
+            base_url: str or None = None,
+            session: requests.Session or None = None
+    ):
+        self._base_url = base_url or os.environ.get('FOOTBALL_DATA_BASE_URL')
+        self._max_workers = max_workers
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._timeout = timeout
+        self._raw_data_cache = None if raw_data_directory is None else RawDataCache(
+            raw_data_directory=raw_data_directory
+        )
+
+        # A session passed in is shared with other downloads and closed by its owner.
+        self._owns_session = session is None
+        self._session = create_session(max_connections=max_workers) if session is None else session
+
+    def __enter__(self) -> 'FootballDataAPI':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        if self._owns_session:
+            self._session.close()
+
     def download(self, league: League) -> pd.DataFrame:
         matches_df = self._download(league=league)
         matches_df = self._process_features(matches_df=matches_df)
         matches_df = matches_df.drop_duplicates()
         matches_df = matches_df.iloc[::-1].reset_index(drop=True)
+        matches_df[['Home Team', 'Away Team']] = matches_df[['Home Team', 'Away Team']].astype('category')
+        return matches_df
+
+    def _read_csv(self, content: bytes) -> pd.DataFrame:
+        if self.SourceColumns is None:
+            return pd.read_csv(io.BytesIO(content))
+
+        # Older seasons may miss some columns (e.g. odds), which are then filled with NaN.
+        dtypes = {column: dtype for column, dtype in self.SourceColumns.items() if dtype is not None}
+        matches_df = pd.read_csv(io.BytesIO(content), usecols=lambda column: column in self.SourceColumns, dtype=dtypes)
+
+        # Casting to str again would turn missing values into 'nan', so text columns keep the NaN read_csv gives them.
+        return matches_df.reindex(columns=list(self.SourceColumns.keys())).astype({
+            column: dtype for column, dtype in dtypes.items() if dtype is not str
+        })
+
+    def _resolve_url(self, url: str) -> str:
+        if self._base_url is None:
+            return url
+
+        url_parts = urlsplit(url)
+        base_url_parts = urlsplit(self._base_url)
+        return urlunsplit((
+            base_url_parts.scheme,
+            base_url_parts.netloc,
+            base_url_parts.path.rstrip('/') + url_parts.path,
+            url_parts.query,
+            url_parts.fragment
+        ))
+
+    def _fetch_csv(self, url: str, immutable: bool = False) -> pd.DataFrame:
+        url = self._resolve_url(url=url)
+        cached_content, cached_metadata = (None, None) if self._raw_data_cache is None else \
+            self._raw_data_cache.load(url=url)
+
+        if cached_content is not None and cached_metadata['immutable']:
+            return self._read_csv(content=cached_content)
+
+        headers = {}
+        if cached_content is not None:
+            if cached_metadata['etag'] is not None:
+                headers['If-None-Match'] = cached_metadata['etag']
+            if cached_metadata['last_modified'] is not None:
+                headers['If-Modified-Since'] = cached_metadata['last_modified']
+
+        response = self._request(url=url, headers=headers)
+        if response.status_code == 304:
+            if immutable:
+                self._raw_data_cache.store(
+                    url=url,
+                    content=cached_content,
+                    etag=cached_metadata['etag'],
+                    last_modified=cached_metadata['last_modified'],
+                    immutable=True
+                )
+            return self._read_csv(content=cached_content)
+
+        try:
+            matches_df = self._read_csv(content=response.content)
+        except (pd.errors.EmptyDataError, pd.errors.ParserError, UnicodeDecodeError):
+            raise SeasonNotPublishedError(url)
+
+        if self._raw_data_cache is not None:
+            self._raw_data_cache.store(
+                url=url,
+                content=response.content,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                immutable=immutable
+            )
         return matches_df
 
+    def _request(self, url: str, headers: dict) -> requests.Response:
+        for attempt in range(self._max_retries + 1):
+            try:
+                response = self._session.get(url, headers=headers, timeout=self._timeout)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                failure = error
+            else:
+                if response.status_code == 404:
+                    raise SeasonNotPublishedError(url)
+                elif response.status_code in self.TransientStatusCodes:
+                    failure = f'HTTP {response.status_code}'
+                elif not response.ok and response.status_code != 304:
+                    raise SeasonDownloadError(f'{url}: HTTP {response.status_code}')
+                else:
+                    return response
+
+            if attempt < self._max_retries:
+                time.sleep(self._retry_backoff_seconds * 2 ** attempt)
+        raise SeasonDownloadError(f'{url}: {failure} after {self._max_retries + 1} attempts')
+
+    def _fetch_csvs(self, url_list: list, immutable_list: list) -> list:
+        executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        futures = [
+            executor.submit(self._fetch_csv, url, immutable) for url, immutable in zip(url_list, immutable_list)
+        ]
+        matches_dfs = []
+
+        try:
+            for future in futures:
+                try:
+                    matches_dfs.append(future.result())
+                except SeasonNotPublishedError:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return matches_dfs
+
     @abstractmethod
     def _download(self, league: League) -> pd.DataFrame:
         pass
@@ -0,0 +1,43 @@
+import hashlib
+import json
+import os
+from infra.repositories.storage import write_bytes, write_text
+
+
+class RawDataCache:
+    def __init__(self, raw_data_directory: str):
+        self._raw_data_directory = raw_data_directory
+
+        os.makedirs(self._raw_data_directory, exist_ok=True)
+
+    def _get_filepath(self, url: str) -> str:
+        return f'{self._raw_data_directory}{hashlib.sha1(url.encode("utf-8")).hexdigest()}'
+
+    def load(self, url: str) -> (bytes, dict) or (None, None):
+        filepath = self._get_filepath(url=url)
+
+        try:
+            with open(f'{filepath}.json', 'r', encoding='utf-8') as fp:
+                metadata = json.load(fp)
+            with open(f'{filepath}.csv', 'rb') as fp:
+                content = fp.read()
+        except (FileNotFoundError, ValueError):
+            return None, None
+
+        # Content and metadata are replaced one after the other, so validators describing other bytes are a miss.
+        if metadata.get('sha256') != hashlib.sha256(content).hexdigest():
+            return None, None
+        return content, metadata
+
+    def store(self, url: str, content: bytes, etag: str or None, last_modified: str or None, immutable: bool):
+        filepath = self._get_filepath(url=url)
+        metadata = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'immutable': immutable,
+            'sha256': hashlib.sha256(content).hexdigest()
+        }
+
+        write_bytes(content=content, filepath=f'{filepath}.csv')
+        write_text(text=json.dumps(metadata), filepath=f'{filepath}.json')
@@ -1,11 +1,25 @@
+import numpy as np
 import pandas as pd
-from infra.repositories.league import League
+from infra.repositories.entities.league import League
 from infra.clients.footballdata.api import FootballDataAPI
 
 
 class ExtraLeagueAPI(FootballDataAPI):
+    SourceColumns = {
+        'Date': str,
+        'Season': None,
+        'Home': 'category',
+        'Away': 'category',
+        'AvgH': np.float32,
+        'AvgD': np.float32,
+        'AvgA': np.float32,
+        'HG': np.float64,
+        'AG': np.float64,
+        'Res': str
+    }
+
     def _download(self, league: League) -> pd.DataFrame:
-        return pd.read_csv(league.url)
+        return self._fetch_csv(url=league.url)
 
     def _process_features(self, matches_df: pd.DataFrame) -> pd.DataFrame:
         matches_df = matches_df[['Date', 'Season', 'Home', 'Away', 'AvgH', 'AvgD', 'AvgA', 'HG', 'AG', 'Res']]
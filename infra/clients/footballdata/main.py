@@ -1,21 +1,33 @@
+import numpy as np
 import pandas as pd
 from datetime import date
-from infra.repositories.league import League
+from infra.repositories.entities.league import League
 from infra.clients.footballdata.api import FootballDataAPI
 
 
 class MainLeagueAPI(FootballDataAPI):
+    SourceColumns = {
+        'Date': str,
+        'HomeTeam': 'category',
+        'AwayTeam': 'category',
+        'B365H': np.float32,
+        'B365D': np.float32,
+        'B365A': np.float32,
+        'FTHG': np.float64,
+        'FTAG': np.float64,
+        'FTR': str
+    }
+
     def _download(self, league: League) -> pd.DataFrame:
         url_list = self._generate_url_list(league=league)
+        immutable_list = [
+            self._is_finished_season(year=year) for year in range(league.year_start, date.today().year + 1)
+        ]
         league_matches_dfs = []
 
-        for i, url in enumerate(url_list):
-            try:
-                matches_df = pd.read_csv(url)
-                matches_df['Season'] = league.year_start + i
-                league_matches_dfs.append(matches_df)
-            except:
-                break
+        for i, matches_df in enumerate(self._fetch_csvs(url_list=url_list, immutable_list=immutable_list)):
+            matches_df['Season'] = np.int16(league.year_start + i)
+            league_matches_dfs.append(matches_df)
         return league_matches_dfs[0] if len(league_matches_dfs) == 1 else pd.concat(league_matches_dfs)
 
     def _process_features(self, matches_df: pd.DataFrame) -> pd.DataFrame:
@@ -38,6 +50,10 @@ class MainLeagueAPI(FootballDataAPI):
     def _get_url_year_format(year: int):
         return f'{str(year)[2:]}{str(year + 1)[2:]}'
 
+    @staticmethod
+    def _is_finished_season(year: int) -> bool:
+        return date(year=year + 1, month=7, day=1) <= date.today()
+
     def _generate_url_list(self, league: League):
         return [
             league.url.format(self._get_url_year_format(year=year))
@@ -0,0 +1,59 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from infra.repositories.storage import write_text
+
+
+class FootystatsCache:
+    def __init__(self, cache_directory: str, ttl_seconds: dict, max_memory_entries: int = 1024):
+        self._cache_directory = cache_directory
+        self._ttl_seconds = ttl_seconds
+        self._max_memory_entries = max_memory_entries
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        for endpoint in self._ttl_seconds:
+            os.makedirs(f'{self._cache_directory}{endpoint}', exist_ok=True)
+
+    def _get_filepath(self, endpoint: str, key: str) -> str:
+        return f'{self._cache_directory}{endpoint}/{key}.json'
+
+    def _is_expired(self, endpoint: str, stored_at: float) -> bool:
+        return time.time() - stored_at > self._ttl_seconds[endpoint]
+
+    def _remember(self, endpoint: str, key: str, stored_at: float, data):
+        with self._lock:
+            self._memory[(endpoint, key)] = (stored_at, data)
+            self._memory.move_to_end((endpoint, key))
+
+            while len(self._memory) > self._max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def load(self, endpoint: str, key: str):
+        with self._lock:
+            entry = self._memory.get((endpoint, key))
+            if entry is not None:
+                self._memory.move_to_end((endpoint, key))
+
+        if entry is None:
+            try:
+                with open(self._get_filepath(endpoint=endpoint, key=key), 'r', encoding='utf-8') as fp:
+                    entry = json.load(fp)
+            except (FileNotFoundError, ValueError):
+                return None
+
+            entry = (entry['stored_at'], entry['data'])
+            self._remember(endpoint=endpoint, key=key, stored_at=entry[0], data=entry[1])
+
+        stored_at, data = entry
+        return None if self._is_expired(endpoint=endpoint, stored_at=stored_at) else data
+
+    def store(self, endpoint: str, key: str, data):
+        stored_at = time.time()
+        write_text(
+            text=json.dumps({'stored_at': stored_at, 'data': data}, ensure_ascii=False),
+            filepath=self._get_filepath(endpoint=endpoint, key=key)
+        )
+        self._remember(endpoint=endpoint, key=key, stored_at=stored_at, data=data)
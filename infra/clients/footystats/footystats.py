@@ -1,34 +1,143 @@
+import asyncio
+import os
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from infra.clients.footystats.cache import FootystatsCache
+from infra.clients.footystats.rate_limiter import TokenBucket
+
+
+class FootystatsError(Exception):
+    pass
 
 
 class FootystatsClient(object):
-    def __init__(self):
-        self.__api_key = "4e8734fa37e80bd0222340ecd1be45b4352545e56f40e9579b32fb055ea750b8"
+    DefaultBaseUrl = 'https://api.football-data-api.com'
+    TransientStatusCodes = {408, 429, 500, 502, 503, 504}
+    DefaultCacheTtlSeconds = {'team': 30 * 24 * 3600, 'league-teams': 30 * 24 * 3600, 'league-list': 24 * 3600}
+
+    def __init__(
+            self,
+            api_key: str or None = None,
+            base_url: str or None = None,
+            max_connections: int = 8,
+            max_retries: int = 3,
+            retry_backoff_seconds: float = 1.0,
+            timeout: tuple = (5, 30),
+            requests_per_hour: int = 1800,
+            burst_size: int = 30,
+            cache_directory: str or None = None,
+            cache_ttl_seconds: dict or None = None
+    ):
+        self.__api_key = api_key or os.environ.get('FOOTYSTATS_API_KEY')
+        self.__base_url = (base_url or os.environ.get('FOOTYSTATS_BASE_URL') or self.DefaultBaseUrl).rstrip('/')
+        self.__max_retries = max_retries
+        self.__retry_backoff_seconds = retry_backoff_seconds
+        self.__timeout = timeout
+        self.__rate_limiter = TokenBucket(rate_per_second=requests_per_hour / 3600, capacity=burst_size)
+        self.__cache = None if cache_directory is None else FootystatsCache(
+            cache_directory=cache_directory,
+            ttl_seconds={**self.DefaultCacheTtlSeconds, **(cache_ttl_seconds or {})}
+        )
+
+        if self.__api_key is None:
+            raise ValueError('Footystats API key is missing, pass api_key or set FOOTYSTATS_API_KEY')
+
+        self.__session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections)
+        self.__session.mount('http://', adapter)
+        self.__session.mount('https://', adapter)
+
+    def __get_retry_delay(self, response: requests.Response or None, attempt: int) -> float:
+        retry_after = None if response is None else response.headers.get('Retry-After')
+
+        if retry_after is not None and retry_after.isdigit():
+            return float(retry_after)
+        return self.__retry_backoff_seconds * 2 ** attempt
+
+    def __request(self, endpoint: str, params: dict) -> list or dict:
+        url = f'{self.__base_url}/{endpoint}'
+        params = {'key': self.__api_key, **params}
+
+        for attempt in range(self.__max_retries + 1):
+            self.__rate_limiter.acquire()
+            response = None
+
+            try:
+                response = self.__session.get(url, params=params, timeout=self.__timeout)
+            except (requests.ConnectionError, requests.Timeout) as error:
+                failure = error
+            else:
+                if response.status_code in self.TransientStatusCodes:
+                    failure = f'HTTP {response.status_code}'
+                elif not response.ok:
+                    raise FootystatsError(f'{endpoint}: HTTP {response.status_code}')
+                else:
+                    try:
+                        return response.json().get('data')
+                    except ValueError:
+                        raise FootystatsError(f'{endpoint}: response is not valid JSON')
+
+            if attempt < self.__max_retries:
+                time.sleep(self.__get_retry_delay(response=response, attempt=attempt))
+        raise FootystatsError(f'{endpoint}: {failure} after {self.__max_retries + 1} attempts')
 
     def get_today_matches(self):
-        try:
-            utc = '-03'
-            return requests.get(
-                url=f"https://api.football-data-api.com/todays-matches?key={self.__api_key}&timezone={utc}"
-            ).json().get('data')
-        except Exception as e:
-            print(e)
-            raise e
+        return self.__request(endpoint='todays-matches', params={'timezone': '-03'})
+
+    def __cached_request(self, endpoint: str, key: str, params: dict) -> list or dict:
+        if self.__cache is None:
+            return self.__request(endpoint=endpoint, params=params)
+
+        data = self.__cache.load(endpoint=endpoint, key=key)
+        if data is None:
+            data = self.__request(endpoint=endpoint, params=params)
+            self.__cache.store(endpoint=endpoint, key=key, data=data)
+        return data
 
     def get_team_info(self, team_id: int):
-        try:
-            return requests.get(
-                url=f"https://api.football-data-api.com/team?key={self.__api_key}&team_id={team_id}"
-            ).json().get('data')
-        except Exception as e:
-            print(e)
-            raise e
+        return self.__cached_request(endpoint='team', key=str(team_id), params={'team_id': team_id})
 
     def get_league_info(self, ):
-        try:
-            return requests.get(
-                url=f"https://api.football-data-api.com/league-list?key={self.__api_key}&chosen_leagues_only=true"
-            ).json().get('data')
-        except Exception as e:
-            print(e)
-            raise e
+        return self.__cached_request(endpoint='league-list', key='chosen', params={'chosen_leagues_only': 'true'})
+
+    def get_league_teams(self, season_id: int):
+        return self.__request(endpoint='league-teams', params={'season_id': season_id})
+
+    def warm_up_teams(self, season_id: int) -> int:
+        if self.__cache is None:
+            return 0
+
+        if self.__cache.load(endpoint='league-teams', key=str(season_id)) is not None:
+            return 0
+
+        league_teams = self.get_league_teams(season_id=season_id) or []
+        for team in league_teams:
+            self.__cache.store(endpoint='team', key=str(team['id']), data=[team])
+        self.__cache.store(endpoint='league-teams', key=str(season_id), data=[team['id'] for team in league_teams])
+        return len(league_teams)
+
+
+class AsyncFootystatsClient(object):
+    def __init__(self, client: FootystatsClient, max_concurrency: int = 8):
+        self.__client = client
+        self.__semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __run(self, fn, **kwargs):
+        async with self.__semaphore:
+            return await asyncio.to_thread(fn, **kwargs)
+
+    async def get_today_matches(self):
+        return await self.__run(self.__client.get_today_matches)
+
+    async def get_team_info(self, team_id: int):
+        return await self.__run(self.__client.get_team_info, team_id=team_id)
+
+    async def get_league_info(self):
+        return await self.__run(self.__client.get_league_info)
+
+    async def get_league_teams(self, season_id: int):
+        return await self.__run(self.__client.get_league_teams, season_id=season_id)
+
+    async def warm_up_teams(self, season_id: int) -> int:
+        return await self.__run(self.__client.warm_up_teams, season_id=season_id)
@@ -0,0 +1,28 @@
+import threading
+import time
+
+
+class TokenBucket:
+    def __init__(self, rate_per_second: float, capacity: int):
+        self._rate_per_second = rate_per_second
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate_per_second)
+        self._updated_at = now
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                self._refill()
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_seconds = (1 - self._tokens) / self._rate_per_second
+            time.sleep(wait_seconds)
@@ -8,6 +8,7 @@ teams = {
     "São Paulo": "Sao Paulo",
     "Atlético Mineiro": "Atletico-MG",
     "Atlético PR": "Atletico-PR",
+    "Atlético Goianiense": "Atletico-GO",
     "Corinthians": "Corinthians",
     "Vasco da Gama": "Vasco",
     "Bahia": "Bahia",
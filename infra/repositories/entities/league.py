@@ -1,4 +1,6 @@
 class League:
+    __slots__ = ('_country', '_name', '_url', '_year_start', '_league_type', '_fixtures_url')
+
     def __init__(
             self,
             country: str,
@@ -31,10 +33,6 @@ class League:
     def year_start(self) -> int:
         return self._year_start
 
-    @year_start.setter
-    def year_start(self, year_start: int):
-        self._year_start = year_start
-
     @property
     def league_type(self) -> str:
         return self._league_type
@@ -42,3 +40,15 @@ class League:
     @property
     def fixtures_url(self) -> str:
         return self._fixtures_url
+
+    def _key(self) -> tuple:
+        return self._country, self._name, self._url, self._year_start, self._league_type, self._fixtures_url
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, League) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f'League(country={self._country!r}, name={self._name!r}, league_type={self._league_type!r})'
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import os
+import pandas as pd
+from infra.repositories.storage import read_frame, write_frame
+
+
+class FeatureStore:
+    def __init__(self, features_directory: str, max_size_bytes: int):
+        self._features_directory = features_directory
+        self._max_size_bytes = max_size_bytes
+
+        os.makedirs(self._features_directory, exist_ok=True)
+
+    @staticmethod
+    def get_key(matches_df: pd.DataFrame, parameters: dict, engine_version: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(json.dumps(list(matches_df.columns)).encode('utf-8'))
+        digest.update(pd.util.hash_pandas_object(matches_df, index=False).to_numpy().tobytes())
+        digest.update(json.dumps(parameters, sort_keys=True).encode('utf-8'))
+        digest.update(engine_version.encode('utf-8'))
+        return digest.hexdigest()
+
+    def _get_filepath(self, key: str) -> str:
+        return f'{self._features_directory}{key}.feather'
+
+    def load(self, key: str) -> pd.DataFrame or None:
+        filepath = self._get_filepath(key=key)
+
+        # Another process may evict the entry at any point, which is just a cache miss.
+        try:
+            os.utime(filepath)
+            return read_frame(filepath=filepath)
+        except FileNotFoundError:
+            return None
+
+    def store(self, key: str, matches_df: pd.DataFrame):
+        filepath = self._get_filepath(key=key)
+        write_frame(matches_df=matches_df, filepath=filepath, keep_index=True)
+        self._evict()
+
+    def _remove(self, filename: str):
+        try:
+            os.remove(f'{self._features_directory}{filename}')
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        # Temp files end in .tmp and belong to writes still in progress, in this process or another one.
+        entries = []
+        for filename in os.listdir(self._features_directory):
+            if filename.endswith('.feather'):
+                try:
+                    stat = os.stat(f'{self._features_directory}{filename}')
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, filename))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, filename in sorted(entries)[:-1]:
+            if total_size <= self._max_size_bytes:
+                break
+
+            self._remove(filename=filename)
+            total_size -= size
+
+    def clear(self):
+        for filename in os.listdir(self._features_directory):
+            if not filename.endswith('.tmp'):
+                self._remove(filename=filename)
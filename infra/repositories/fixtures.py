@@ -0,0 +1,50 @@
+import json
+import os
+from datetime import date
+from infra.clients.footystats.footystats import FootystatsClient
+from infra.repositories.storage import write_text
+
+
+class FixturesRepository:
+    def __init__(self, footystats_client: FootystatsClient, fixtures_directory: str or None = None):
+        self._footystats_client = footystats_client
+        self._fixtures_directory = fixtures_directory
+        self._fixtures = {}
+
+        if self._fixtures_directory is not None:
+            os.makedirs(self._fixtures_directory, exist_ok=True)
+
+    def _get_snapshot_filepath(self, day: date) -> str:
+        return f'{self._fixtures_directory}{day.isoformat()}.json'
+
+    def _load_snapshot(self, day: date) -> list:
+        if self._fixtures_directory is not None:
+            try:
+                with open(self._get_snapshot_filepath(day=day), 'r', encoding='utf-8') as fp:
+                    return json.load(fp)
+            except FileNotFoundError:
+                pass
+
+        # The API only serves today's matches, so any other day has to come from its snapshot.
+        if day != date.today():
+            raise ValueError(f'No fixtures snapshot for {day.isoformat()}, and only today\'s fixtures can be fetched')
+
+        matches = self._footystats_client.get_today_matches() or []
+
+        # An empty response may be a transient API hiccup, so it is not pinned for the rest of the day.
+        if self._fixtures_directory is not None and len(matches) > 0:
+            write_text(text=json.dumps(matches, ensure_ascii=False), filepath=self._get_snapshot_filepath(day=day))
+        return matches
+
+    def get_fixtures_by_competition(self, day: date or None = None) -> dict:
+        day = date.today() if day is None else day
+
+        if day not in self._fixtures:
+            fixtures = {}
+            for match in self._load_snapshot(day=day):
+                fixtures.setdefault(match.get('competition_id'), []).append(match)
+            self._fixtures = {day: fixtures}
+        return self._fixtures[day]
+
+    def get_fixtures(self, competition_id: int, day: date or None = None) -> list:
+        return self.get_fixtures_by_competition(day=day).get(competition_id, [])
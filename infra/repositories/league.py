@@ -1,33 +1,95 @@
-import csv
 import json
 import os
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
+import requests
 from infra.repositories.entities.league import League
+from infra.repositories.feature_store import FeatureStore
+from infra.repositories.registry import LeagueRegistry
+from infra.repositories.storage import is_readable_frame, lock_file, read_frame, write_frame, write_text
+from infra.clients.footballdata.api import create_session
 from infra.clients.footballdata.extra import ExtraLeagueAPI
 from infra.clients.footballdata.main import MainLeagueAPI
-from domain.processing.statistics import StatisticsEngine
+from domain.processing.head_to_head import HeadToHeadIndex
+from domain.processing.history import MatchHistory
+from domain.processing.statistics import RollingStatisticsEngine, StatisticsCube, StatisticsEngine
+from domain.processing.team_form import TeamForm
+
+
+_worker_session = None
+
+
+def _get_worker_session() -> requests.Session:
+    # Each pool process keeps one session, so the leagues it builds share its connection pool.
+    global _worker_session
+
+    if _worker_session is None:
+        _worker_session = create_session()
+    return _worker_session
+
+
+def _create_league_worker(
+        available_leagues_filepath: str,
+        saved_leagues_directory: str,
+        feature_store: FeatureStore or None,
+        raw_data_directory: str or None,
+        num_previous_versions: int,
+        league: League,
+        last_n_matches: int,
+        goal_diff_margin: int,
+        statistic_columns: list,
+        league_name: str
+) -> int or None:
+    matches_df, _ = LeagueRepository(
+        available_leagues_filepath=available_leagues_filepath,
+        saved_leagues_directory=saved_leagues_directory,
+        feature_store=feature_store,
+        raw_data_directory=raw_data_directory,
+        num_previous_versions=num_previous_versions,
+        session=_get_worker_session()
+    ).create_league(
+        league=league,
+        last_n_matches=last_n_matches,
+        goal_diff_margin=goal_diff_margin,
+        statistic_columns=statistic_columns,
+        league_name=league_name
+    )
+    return None if matches_df is None else matches_df.shape[0]
 
 
 class LeagueRepository:
-    def __init__(self, available_leagues_filepath: str, saved_leagues_directory: str):
+    def __init__(
+            self,
+            available_leagues_filepath: str,
+            saved_leagues_directory: str,
+            feature_store: FeatureStore or None = None,
+            raw_data_directory: str or None = None,
+            num_previous_versions: int = 2,
+            session: requests.Session or None = None
+    ):
         self._available_leagues_filepath = available_leagues_filepath
+        self._session = session
         self._saved_leagues_directory = saved_leagues_directory
+        self._feature_store = feature_store
+        self._raw_data_directory = raw_data_directory
+        self._num_previous_versions = num_previous_versions
+        self._league_registry = LeagueRegistry(available_leagues_filepath=available_leagues_filepath)
 
         os.makedirs(self._saved_leagues_directory, exist_ok=True)
 
     def get_all_available_leagues(self) -> dict:
-        with open(file=self._available_leagues_filepath, mode='r', encoding='utf=8') as csvfile:
-            reader = csv.reader(csvfile, delimiter=',')
-            next(reader)
-
-            return {(row[0], row[1]): League(
-                country=row[0],
-                name=row[1],
-                url=row[2],
-                year_start=int(row[3]),
-                league_type=row[4],
-                fixtures_url=row[5]
-            ) for row in reader}
+        return self._league_registry.get_all()
+
+    def get_available_league(self, country: str, name: str) -> League or None:
+        return self._league_registry.get(country=country, name=name)
+
+    def get_available_leagues_by_type(self, league_type: str) -> tuple:
+        return self._league_registry.get_by_type(league_type=league_type)
+
+    def get_available_leagues_by_fixtures_url(self, fixtures_url: str) -> tuple:
+        return self._league_registry.get_by_fixtures_url(fixtures_url=fixtures_url)
 
     def get_all_saved_leagues(self) -> list:
         all_filepaths = os.listdir(self._saved_leagues_directory)
@@ -37,31 +99,396 @@ class LeagueRepository:
     def get_all_available_columns() -> list:
         return StatisticsEngine.Columns
 
+    @staticmethod
+    def get_all_form_columns() -> list:
+        return StatisticsEngine.FormColumns
+
+    @staticmethod
+    def get_all_head_to_head_columns() -> list:
+        return StatisticsEngine.HeadToHeadColumns
+
+    def _get_snapshot_filepath(self, league_name: str, version: int) -> str:
+        return f'{self._saved_leagues_directory}{league_name}.{version}.feather'
+
+    def _get_team_form_filepath(self, league_name: str, version: int) -> str:
+        return f'{self._saved_leagues_directory}{league_name}.{version}.form.feather'
+
+    def _get_pointer_filepath(self, league_name: str) -> str:
+        return f'{self._saved_leagues_directory}{league_name}.current'
+
+    def _get_lock_filepath(self, league_name: str) -> str:
+        return f'{self._saved_leagues_directory}{league_name}.lock'
+
+    def _get_metadata_filepath(self, league_name: str) -> str:
+        return f'{self._saved_leagues_directory}{league_name}.meta.json'
+
+    def _get_legacy_league_filepaths(self, league_name: str) -> list:
+        return [
+            f'{self._saved_leagues_directory}{league_name}.feather',
+            f'{self._saved_leagues_directory}{league_name}.csv'
+        ]
+
+    def get_league_versions(self, league_name: str) -> list:
+        versions = []
+        for filename in os.listdir(self._saved_leagues_directory):
+            parts = filename.split(sep='.')
+
+            if len(parts) == 3 and parts[0] == league_name and parts[1].isdigit() and parts[2] == 'feather':
+                versions.append(int(parts[1]))
+        return sorted(versions)
+
+    def _get_current_version(self, league_name: str) -> int or None:
+        try:
+            with open(self._get_pointer_filepath(league_name=league_name), 'r', encoding='utf-8') as fp:
+                return int(fp.read())
+        except FileNotFoundError:
+            return None
+
     def league_exists(self, league_name: str) -> bool:
-        league_filepath = f'{self._saved_leagues_directory}{league_name}.csv'
-        return os.path.exists(league_filepath)
+        return os.path.exists(self._get_pointer_filepath(league_name=league_name)) or any(
+            os.path.exists(filepath) for filepath in self._get_legacy_league_filepaths(league_name=league_name)
+        )
 
-    def _store_league(
+    def _migrate_legacy_league(self, league_name: str):
+        if self._get_current_version(league_name=league_name) is not None:
+            return
+
+        for legacy_filepath in self._get_legacy_league_filepaths(league_name=league_name):
+            if os.path.exists(legacy_filepath):
+                if legacy_filepath.endswith('.csv'):
+                    matches_df = pd.read_csv(legacy_filepath)
+                else:
+                    matches_df = read_frame(filepath=legacy_filepath)
+
+                self._write_snapshot(matches_df=matches_df, league_name=league_name)
+                os.remove(legacy_filepath)
+                return
+
+    def _read_league(
             self,
-            matches_df: pd.DataFrame,
-            league_config: dict,
             league_name: str,
-            store_league_config: bool
+            columns: list or None = None,
+            memory_map: bool = False
     ) -> pd.DataFrame:
-        matches_df = StatisticsEngine(
+        self._migrate_legacy_league(league_name=league_name)
+
+        # A writer may prune the snapshot between reading the pointer and opening it, so the pointer is re-read once.
+        for attempt in range(2):
+            version = self._get_current_version(league_name=league_name)
+            try:
+                return read_frame(
+                    filepath=self._get_snapshot_filepath(league_name=league_name, version=version),
+                    columns=columns,
+                    memory_map=memory_map
+                )
+            except FileNotFoundError:
+                if attempt == 1 or self._get_current_version(league_name=league_name) == version:
+                    raise
+
+    def _write_snapshot(
+            self,
+            matches_df: pd.DataFrame,
+            league_name: str,
+            history_df: pd.DataFrame or None = None
+    ):
+        team_form_df = TeamForm.build(matches_df=matches_df, history_df=history_df).to_frame()
+
+        # Writers of a league take turns, so each picks a fresh version and the pointer only ever moves forward.
+        with lock_file(filepath=self._get_lock_filepath(league_name=league_name)):
+            versions = self.get_league_versions(league_name=league_name)
+            version = versions[-1] + 1 if len(versions) > 0 else 1
+
+            try:
+                # Compressed buffers have to be decoded into memory, so snapshots are left uncompressed to be mmapped.
+                write_frame(
+                    matches_df=matches_df,
+                    filepath=self._get_snapshot_filepath(league_name=league_name, version=version),
+                    compression='uncompressed'
+                )
+                write_frame(
+                    matches_df=team_form_df,
+                    filepath=self._get_team_form_filepath(league_name=league_name, version=version)
+                )
+            except BaseException:
+                self._remove_snapshot(league_name=league_name, version=version)
+                raise
+
+            write_text(text=str(version), filepath=self._get_pointer_filepath(league_name=league_name))
+
+            # Unreadable snapshots, like the empty version placeholders of earlier releases, are pruned first.
+            previous_versions = []
+            for previous_version in versions:
+                if self._is_valid_snapshot(league_name=league_name, version=previous_version):
+                    previous_versions.append(previous_version)
+                else:
+                    self._remove_snapshot(league_name=league_name, version=previous_version)
+
+            for previous_version in previous_versions[: max(len(previous_versions) - self._num_previous_versions, 0)]:
+                self._remove_snapshot(league_name=league_name, version=previous_version)
+
+    def _is_valid_snapshot(self, league_name: str, version: int) -> bool:
+        return is_readable_frame(filepath=self._get_snapshot_filepath(league_name=league_name, version=version))
+
+    def _remove_snapshot(self, league_name: str, version: int):
+        for filepath in [
+            self._get_snapshot_filepath(league_name=league_name, version=version),
+            self._get_team_form_filepath(league_name=league_name, version=version)
+        ]:
+            try:
+                os.remove(filepath)
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def _get_latest_date(dates: pd.Series) -> datetime or None:
+        dates = pd.to_datetime(dates, dayfirst=True, format='mixed', errors='coerce')
+        return None if dates.isna().all() else dates.max().to_pydatetime()
+
+    def _mark_refreshed(self, league_name: str, history_df: pd.DataFrame):
+        # The stored league drops the first rounds of a season, so the latest match is taken from the raw history.
+        latest_match_date = self._get_latest_date(dates=history_df['Date'])
+        write_text(
+            text=json.dumps({
+                'refreshed_at': datetime.now().isoformat(),
+                'latest_match_date': None if latest_match_date is None else latest_match_date.isoformat()
+            }),
+            filepath=self._get_metadata_filepath(league_name=league_name)
+        )
+
+    def _read_metadata(self, league_name: str) -> dict:
+        try:
+            with open(self._get_metadata_filepath(league_name=league_name), 'r', encoding='utf-8') as fp:
+                return json.load(fp)
+        except FileNotFoundError:
+            return {}
+
+    def rollback_league(self, league_name: str, version: int or None = None) -> bool:
+        with lock_file(filepath=self._get_lock_filepath(league_name=league_name)):
+            current_version = self._get_current_version(league_name=league_name)
+            versions = [
+                v for v in self.get_league_versions(league_name=league_name)
+                if v != current_version and self._is_valid_snapshot(league_name=league_name, version=v)
+            ]
+
+            if version is None:
+                versions = [v for v in versions if current_version is None or v < current_version]
+                if len(versions) == 0:
+                    return False
+
+                version = versions[-1]
+            elif version not in versions:
+                return False
+
+            write_text(text=str(version), filepath=self._get_pointer_filepath(league_name=league_name))
+        return True
+
+    def _get_session(self) -> requests.Session:
+        if self._session is None:
+            self._session = create_session()
+        return self._session
+
+    def _download_matches(self, league: League) -> pd.DataFrame:
+        if league.league_type == 'main':
+            football_data_api = MainLeagueAPI(raw_data_directory=self._raw_data_directory, session=self._get_session())
+        elif league.league_type == 'extra':
+            football_data_api = ExtraLeagueAPI(raw_data_directory=self._raw_data_directory, session=self._get_session())
+        else:
+            raise NotImplementedError(f'League_type = {league.league_type} has not been implemented')
+        return football_data_api.download(league=league)
+
+    @staticmethod
+    def _compute_statistics(matches_df: pd.DataFrame, league_config: dict) -> pd.DataFrame:
+        return RollingStatisticsEngine(
             matches_df=matches_df,
             last_n_matches=league_config['last_n_matches'],
-            goal_diff_margin=league_config['goal_diff_margin']
+            goal_diff_margin=league_config['goal_diff_margin'],
+            form_decay_factor=league_config.get('form_decay_factor', StatisticsEngine.DefaultFormDecayFactor)
         ).compute_statistics(statistic_columns=league_config['statistic_columns'])
 
-        league_filepath = f'{self._saved_leagues_directory}{league_name}.csv'
-        matches_df.to_csv(league_filepath, index=False)
+    def compute_statistics_cube(
+            self,
+            league_name: str,
+            last_n_matches_list: list,
+            goal_diff_margins: list
+    ) -> StatisticsCube or None:
+        if not self.league_exists(league_name=league_name):
+            return None
+
+        with open(f'{self._saved_leagues_directory}{league_name}.json', 'r', encoding='utf-8') as fp:
+            league_config = json.load(fp)
+        league = self.get_all_available_leagues()[(league_config['country'], league_config['name'])]
+
+        # The saved league has its incomplete rows dropped, so the cube is computed from the full match history.
+        return RollingStatisticsEngine(
+            matches_df=self._download_matches(league=league),
+            last_n_matches=league_config['last_n_matches'],
+            goal_diff_margin=league_config['goal_diff_margin'],
+            form_decay_factor=league_config.get('form_decay_factor', StatisticsEngine.DefaultFormDecayFactor)
+        ).compute_statistics_cube(
+            statistic_columns=league_config['statistic_columns'],
+            last_n_matches_list=last_n_matches_list,
+            goal_diff_margins=goal_diff_margins
+        )
+
+    def update_statistics_parameters(
+            self,
+            league_name: str,
+            last_n_matches: int,
+            goal_diff_margin: int
+    ) -> pd.DataFrame or None:
+        if not self.league_exists(league_name=league_name):
+            return None
+
+        with open(f'{self._saved_leagues_directory}{league_name}.json', 'r', encoding='utf-8') as fp:
+            league_config = json.load(fp)
+        league = self.get_all_available_leagues()[(league_config['country'], league_config['name'])]
+        league_config['last_n_matches'] = last_n_matches
+        league_config['goal_diff_margin'] = goal_diff_margin
+
+        # The league, its team form and the config are rebuilt together, so predictions use the tuned features.
+        return self._store_league(
+            matches_df=self._download_matches(league=league),
+            league_config=league_config,
+            league_name=league_name,
+            store_league_config=True
+        )
+
+    def get_or_compute_statistics(self, matches_df: pd.DataFrame, league_config: dict) -> pd.DataFrame:
+        if self._feature_store is None:
+            return self._compute_statistics(matches_df=matches_df, league_config=league_config)
+
+        key = FeatureStore.get_key(
+            matches_df=matches_df,
+            parameters={
+                'last_n_matches': league_config['last_n_matches'],
+                'goal_diff_margin': league_config['goal_diff_margin'],
+                'statistic_columns': league_config['statistic_columns'],
+                'form_decay_factor': league_config.get('form_decay_factor', StatisticsEngine.DefaultFormDecayFactor)
+            },
+            engine_version=StatisticsEngine.Version
+        )
+        statistics_df = self._feature_store.load(key=key)
+
+        if statistics_df is None:
+            statistics_df = self._compute_statistics(matches_df=matches_df, league_config=league_config)
+            self._feature_store.store(key=key, matches_df=statistics_df)
+        return statistics_df
 
+    def _write_league(
+            self,
+            matches_df: pd.DataFrame,
+            league_config: dict,
+            league_name: str,
+            store_league_config: bool,
+            history_df: pd.DataFrame
+    ):
         if store_league_config:
             league_config_filepath = f'{self._saved_leagues_directory}{league_name}.json'
-            with open(file=league_config_filepath, mode='w', encoding='utf-8') as fp:
-                json.dump(league_config, fp)
-        return matches_df
+            write_text(text=json.dumps(league_config), filepath=league_config_filepath)
+
+        self._write_snapshot(matches_df=matches_df, league_name=league_name, history_df=history_df)
+        self._mark_refreshed(league_name=league_name, history_df=history_df)
+
+    def _store_league(
+            self,
+            matches_df: pd.DataFrame,
+            league_config: dict,
+            league_name: str,
+            store_league_config: bool
+    ) -> pd.DataFrame:
+        statistics_df = self.get_or_compute_statistics(matches_df=matches_df, league_config=league_config)
+        self._write_league(
+            matches_df=statistics_df,
+            league_config=league_config,
+            league_name=league_name,
+            store_league_config=store_league_config,
+            history_df=matches_df
+        )
+        return statistics_df
+
+    def _compute_new_matches_statistics(
+            self,
+            matches_df: pd.DataFrame,
+            saved_matches_df: pd.DataFrame,
+            league_config: dict
+    ) -> pd.DataFrame or None:
+        if saved_matches_df.shape[0] == 0:
+            return None
+
+        matches_df = matches_df.reset_index(drop=True)
+        latest_saved_match = saved_matches_df.iloc[0]
+        is_latest_saved_match = np.ones(shape=matches_df.shape[0], dtype=bool)
+        for key in ['Season', 'Date', 'Home Team', 'Away Team']:
+            is_latest_saved_match &= (matches_df[key] == latest_saved_match[key]).to_numpy()
+        latest_saved_match_ids = np.flatnonzero(is_latest_saved_match)
+
+        if latest_saved_match_ids.shape[0] == 0:
+            return None
+
+        num_new_matches = latest_saved_match_ids[0]
+        if num_new_matches == 0:
+            return saved_matches_df.iloc[0: 0]
+
+        # Statistics only look backward within a season, so the seasons of the new matches are enough context.
+        statistic_columns = league_config['statistic_columns']
+        head_to_head_columns = [column for column in statistic_columns if column in StatisticsEngine.HeadToHeadColumns]
+        new_seasons = matches_df['Season'].iloc[: num_new_matches].unique()
+        new_matches_df = self.get_or_compute_statistics(
+            matches_df=matches_df[matches_df['Season'].isin(new_seasons)],
+            league_config={
+                **league_config,
+                'statistic_columns': [column for column in statistic_columns if column not in head_to_head_columns]
+            }
+        )
+        new_matches_df = new_matches_df[new_matches_df.index < num_new_matches]
+
+        if len(head_to_head_columns) == 0:
+            return new_matches_df
+
+        # Head-to-head statistics look back across seasons, so the new rows alone are looked up in the whole history.
+        head_to_head_index = HeadToHeadIndex(match_history=MatchHistory(matches_df=matches_df))
+        head_to_head_statistics = head_to_head_index.compute_match_statistics(
+            match_ids=new_matches_df.index.to_numpy(), num_meetings=StatisticsEngine.HeadToHeadMatches
+        )
+        new_matches_df = new_matches_df.assign(**{
+            column: head_to_head_statistics[:, StatisticsEngine.HeadToHeadColumns.index(column)]
+            for column in head_to_head_columns
+        })[list(matches_df.columns) + statistic_columns].dropna()
+        return new_matches_df.astype({column: np.int32 for column in head_to_head_columns})
+
+    def _append_league(
+            self,
+            matches_df: pd.DataFrame,
+            league_config: dict,
+            league_name: str
+    ) -> pd.DataFrame:
+        saved_matches_df = self._read_league(league_name=league_name)
+        new_matches_df = self._compute_new_matches_statistics(
+            matches_df=matches_df,
+            saved_matches_df=saved_matches_df,
+            league_config=league_config
+        )
+
+        if new_matches_df is None:
+            return self._store_league(
+                matches_df=matches_df,
+                league_config=league_config,
+                league_name=league_name,
+                store_league_config=False
+            )
+        if new_matches_df.shape[0] == 0:
+            self._mark_refreshed(league_name=league_name, history_df=matches_df)
+            return saved_matches_df
+
+        statistics_df = pd.concat((new_matches_df, saved_matches_df), ignore_index=True)
+        self._write_league(
+            matches_df=statistics_df,
+            league_config=league_config,
+            league_name=league_name,
+            store_league_config=False,
+            history_df=matches_df
+        )
+        return statistics_df
 
     def create_league(
             self,
@@ -69,22 +496,19 @@ class LeagueRepository:
             last_n_matches: int,
             goal_diff_margin: int,
             statistic_columns: list,
-            league_name: str
+            league_name: str,
+            form_decay_factor: float = StatisticsEngine.DefaultFormDecayFactor
     ) -> (pd.DataFrame, League) or (None, None):
         if not self.league_exists(league_name=league_name):
-            if league.league_type == 'main':
-                matches_df = MainLeagueAPI().download(league=league)
-            elif league.league_type == 'extra':
-                matches_df = ExtraLeagueAPI().download(league=league)
-            else:
-                raise NotImplementedError(f'League_type = {league.league_type} has not been implemented')
+            matches_df = self._download_matches(league=league)
 
             league_config = {
                 'country': league.country,
                 'name': league.name,
                 'last_n_matches': last_n_matches,
                 'goal_diff_margin': goal_diff_margin,
-                'statistic_columns': statistic_columns
+                'statistic_columns': statistic_columns,
+                'form_decay_factor': form_decay_factor
             }
             return self._store_league(
                 matches_df=matches_df,
@@ -95,30 +519,84 @@ class LeagueRepository:
         else:
             return None, None
 
-    def update_league(self, league_name: str) -> (pd.DataFrame, League) or (None, None):
+    def create_leagues(
+            self,
+            leagues: list,
+            league_names: list,
+            last_n_matches: int,
+            goal_diff_margin: int,
+            statistic_columns: list,
+            num_workers: int or None = None
+    ) -> dict:
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = {
+                league_name: executor.submit(
+                    _create_league_worker,
+                    available_leagues_filepath=self._available_leagues_filepath,
+                    saved_leagues_directory=self._saved_leagues_directory,
+                    feature_store=self._feature_store,
+                    raw_data_directory=self._raw_data_directory,
+                    num_previous_versions=self._num_previous_versions,
+                    league=league,
+                    last_n_matches=last_n_matches,
+                    goal_diff_margin=goal_diff_margin,
+                    statistic_columns=statistic_columns,
+                    league_name=league_name
+                )
+                for league, league_name in zip(leagues, league_names)
+            }
+
+            results = {}
+            for league_name, future in futures.items():
+                error = future.exception()
+
+                if error is not None:
+                    results[league_name] = {'success': False, 'num_matches': None, 'error': repr(error)}
+                elif future.result() is None:
+                    results[league_name] = {'success': False, 'num_matches': None, 'error': 'League already exists'}
+                else:
+                    results[league_name] = {'success': True, 'num_matches': future.result(), 'error': None}
+            return results
+
+    def update_league(
+            self,
+            league_name: str,
+            incremental: bool = True
+    ) -> (pd.DataFrame, League) or (None, None):
         if self.league_exists(league_name=league_name):
             config_filepath = f'{self._saved_leagues_directory}{league_name}.json'
             with open(config_filepath, 'r', encoding='utf-8') as fp:
                 league_config = json.load(fp)
 
-            if self.delete_league(league_name=league_name):
-                league_key = (league_config['country'], league_config['name'])
-                league = self.get_all_available_leagues()[league_key]
-                return self.create_league(
-                    league=league,
-                    last_n_matches=league_config['last_n_matches'],
-                    goal_diff_margin=league_config['goal_diff_margin'],
-                    statistic_columns=league_config['statistic_columns'],
+            league_key = (league_config['country'], league_config['name'])
+            league = self.get_all_available_leagues()[league_key]
+
+            if incremental:
+                matches_df = self._download_matches(league=league)
+                return self._append_league(
+                    matches_df=matches_df,
+                    league_config=league_config,
                     league_name=league_name
-                )
+                ), league
             else:
-                return None, None
+                matches_df = self._download_matches(league=league)
+                return self._store_league(
+                    matches_df=matches_df,
+                    league_config=league_config,
+                    league_name=league_name,
+                    store_league_config=False
+                ), league
         else:
             return None, None
 
-    def load_league(self, league_name: str) -> (pd.DataFrame, League) or (None, None):
+    def load_league(
+            self,
+            league_name: str,
+            columns: list or None = None,
+            memory_map: bool = False
+    ) -> (pd.DataFrame, League) or (None, None):
         if self.league_exists(league_name=league_name):
-            matches_df = pd.read_csv(f'{self._saved_leagues_directory}{league_name}.csv')
+            matches_df = self._read_league(league_name=league_name, columns=columns, memory_map=memory_map)
 
             with open(f'{self._saved_leagues_directory}{league_name}.json', 'r', encoding='utf-8') as fp:
                 league_config = json.load(fp)
@@ -127,13 +605,76 @@ class LeagueRepository:
         else:
             return None, None
 
+    def load_team_form(self, league_name: str) -> TeamForm or None:
+        if not self.league_exists(league_name=league_name):
+            return None
+
+        self._migrate_legacy_league(league_name=league_name)
+
+        # As in _read_league, a writer may prune the version between reading the pointer and opening its files.
+        for attempt in range(2):
+            version = self._get_current_version(league_name=league_name)
+            team_form_filepath = self._get_team_form_filepath(league_name=league_name, version=version)
+
+            try:
+                if os.path.exists(team_form_filepath):
+                    return TeamForm(form_df=read_frame(filepath=team_form_filepath))
+
+                # Snapshots written before team forms were persisted get theirs built once, from the same version.
+                snapshot_filepath = self._get_snapshot_filepath(league_name=league_name, version=version)
+                team_form = TeamForm.build(matches_df=read_frame(filepath=snapshot_filepath))
+                write_frame(matches_df=team_form.to_frame(), filepath=team_form_filepath)
+
+                if not os.path.exists(snapshot_filepath):
+                    self._remove_snapshot(league_name=league_name, version=version)
+                return team_form
+            except FileNotFoundError:
+                if attempt == 1 or self._get_current_version(league_name=league_name) == version:
+                    raise
+
+    def get_league_updated_at(self, league_name: str) -> datetime or None:
+        self._migrate_legacy_league(league_name=league_name)
+
+        # Rollbacks rewrite the pointer without refreshing anything, so its mtime is only used for leagues saved
+        # before refreshes were recorded.
+        metadata = self._read_metadata(league_name=league_name)
+        if 'refreshed_at' in metadata:
+            return datetime.fromisoformat(metadata['refreshed_at'])
+
+        try:
+            return datetime.fromtimestamp(os.path.getmtime(self._get_pointer_filepath(league_name=league_name)))
+        except FileNotFoundError:
+            return None
+
+    def get_latest_match_date(self, league_name: str) -> datetime or None:
+        if not self.league_exists(league_name=league_name):
+            return None
+
+        # Leagues refreshed before the raw latest match date was recorded fall back to their stored matches.
+        metadata = self._read_metadata(league_name=league_name)
+        if 'latest_match_date' in metadata:
+            return None if metadata['latest_match_date'] is None else \
+                datetime.fromisoformat(metadata['latest_match_date'])
+
+        return self._get_latest_date(dates=self._read_league(league_name=league_name, columns=['Date'])['Date'])
+
     def delete_league(self, league_name: str) -> bool:
-        league_filepath = f'{self._saved_leagues_directory}{league_name}.csv'
         league_config_filepath = f'{self._saved_leagues_directory}{league_name}.json'
 
-        if os.path.exists(league_filepath):
-            os.remove(league_filepath)
+        if self.league_exists(league_name=league_name):
+            if os.path.exists(self._get_pointer_filepath(league_name=league_name)):
+                os.remove(self._get_pointer_filepath(league_name=league_name))
+            if os.path.exists(self._get_metadata_filepath(league_name=league_name)):
+                os.remove(self._get_metadata_filepath(league_name=league_name))
+            if os.path.exists(self._get_lock_filepath(league_name=league_name)):
+                os.remove(self._get_lock_filepath(league_name=league_name))
             os.remove(league_config_filepath)
+
+            for version in self.get_league_versions(league_name=league_name):
+                self._remove_snapshot(league_name=league_name, version=version)
+            for legacy_filepath in self._get_legacy_league_filepaths(league_name=league_name):
+                if os.path.exists(legacy_filepath):
+                    os.remove(legacy_filepath)
             return True
         else:
             return False
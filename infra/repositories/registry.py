@@ -0,0 +1,66 @@
+import csv
+import os
+from types import MappingProxyType
+from infra.repositories.entities.league import League
+
+
+class LeagueRegistry:
+    def __init__(self, available_leagues_filepath: str):
+        self._available_leagues_filepath = available_leagues_filepath
+        self._file_signature = None
+        self._leagues = MappingProxyType({})
+        self._leagues_by_type = MappingProxyType({})
+        self._leagues_by_fixtures_url = MappingProxyType({})
+
+    def _read_leagues(self) -> dict:
+        with open(file=self._available_leagues_filepath, mode='r', encoding='utf=8') as csvfile:
+            reader = csv.reader(csvfile, delimiter=',')
+            next(reader)
+
+            return {(row[0], row[1]): League(
+                country=row[0],
+                name=row[1],
+                url=row[2],
+                year_start=int(row[3]),
+                league_type=row[4],
+                fixtures_url=row[5]
+            ) for row in reader}
+
+    def _reload_if_modified(self):
+        stat = os.stat(self._available_leagues_filepath)
+        file_signature = (stat.st_mtime_ns, stat.st_size)
+
+        if file_signature == self._file_signature:
+            return
+
+        leagues = self._read_leagues()
+        leagues_by_type = {}
+        leagues_by_fixtures_url = {}
+        for league in leagues.values():
+            leagues_by_type.setdefault(league.league_type, []).append(league)
+            leagues_by_fixtures_url.setdefault(league.fixtures_url, []).append(league)
+
+        self._leagues = MappingProxyType(leagues)
+        self._leagues_by_type = MappingProxyType({
+            league_type: tuple(type_leagues) for league_type, type_leagues in leagues_by_type.items()
+        })
+        self._leagues_by_fixtures_url = MappingProxyType({
+            fixtures_url: tuple(url_leagues) for fixtures_url, url_leagues in leagues_by_fixtures_url.items()
+        })
+        self._file_signature = file_signature
+
+    def get_all(self) -> MappingProxyType:
+        self._reload_if_modified()
+        return self._leagues
+
+    def get(self, country: str, name: str) -> League or None:
+        self._reload_if_modified()
+        return self._leagues.get((country, name))
+
+    def get_by_type(self, league_type: str) -> tuple:
+        self._reload_if_modified()
+        return self._leagues_by_type.get(league_type, ())
+
+    def get_by_fixtures_url(self, fixtures_url: str) -> tuple:
+        self._reload_if_modified()
+        return self._leagues_by_fixtures_url.get(fixtures_url, ())
@@ -0,0 +1,95 @@
+import fcntl
+import os
+import tempfile
+from contextlib import contextmanager
+import pandas as pd
+import pyarrow.feather as feather
+
+IndexColumn = '__index__'
+
+
+def _make_temp_filepath(filepath: str) -> str:
+    # Every writer gets its own temp file, so concurrent writes of the same file never clobber each other.
+    fd, temp_filepath = tempfile.mkstemp(
+        prefix=f'{os.path.basename(filepath)}.', suffix='.tmp', dir=os.path.dirname(os.path.abspath(filepath))
+    )
+    os.close(fd)
+    return temp_filepath
+
+
+def _remove_temp_file(temp_filepath: str):
+    try:
+        os.remove(temp_filepath)
+    except FileNotFoundError:
+        pass
+
+
+def _replace_durably(temp_filepath: str, filepath: str):
+    with open(temp_filepath, 'rb') as fp:
+        os.fsync(fp.fileno())
+    os.replace(temp_filepath, filepath)
+
+    # The rename itself is only durable once the parent directory entry is flushed.
+    if hasattr(os, 'O_DIRECTORY'):
+        directory_fd = os.open(os.path.dirname(os.path.abspath(filepath)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(directory_fd)
+        finally:
+            os.close(directory_fd)
+
+
+def write_frame(matches_df: pd.DataFrame, filepath: str, keep_index: bool = False, compression: str = 'zstd'):
+    if keep_index:
+        matches_df = matches_df.rename_axis(IndexColumn).reset_index()
+    else:
+        matches_df = matches_df.reset_index(drop=True)
+
+    temp_filepath = _make_temp_filepath(filepath=filepath)
+    try:
+        matches_df.to_feather(temp_filepath, compression=compression)
+        _replace_durably(temp_filepath=temp_filepath, filepath=filepath)
+    except BaseException:
+        _remove_temp_file(temp_filepath=temp_filepath)
+        raise
+
+
+def is_readable_frame(filepath: str) -> bool:
+    try:
+        feather.read_table(filepath, columns=[], memory_map=True)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def read_frame(filepath: str, columns: list or None = None, memory_map: bool = False) -> pd.DataFrame:
+    matches_df = feather.read_table(filepath, columns=columns, memory_map=memory_map).to_pandas()
+
+    if IndexColumn in matches_df.columns:
+        matches_df = matches_df.set_index(IndexColumn).rename_axis(None)
+    return matches_df
+
+
+def write_bytes(content: bytes, filepath: str):
+    temp_filepath = _make_temp_filepath(filepath=filepath)
+    try:
+        with open(temp_filepath, 'wb') as fp:
+            fp.write(content)
+        _replace_durably(temp_filepath=temp_filepath, filepath=filepath)
+    except BaseException:
+        _remove_temp_file(temp_filepath=temp_filepath)
+        raise
+
+
+def write_text(text: str, filepath: str):
+    write_bytes(content=text.encode('utf-8'), filepath=filepath)
+
+
+@contextmanager
+def lock_file(filepath: str):
+    # The OS drops the lock with its process, so a killed writer never leaves it held.
+    with open(filepath, 'a') as fp:
+        fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
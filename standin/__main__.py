@@ -0,0 +1,58 @@
+import argparse
+
+from standin.fixtures import generate_fixtures, record_fixtures
+from standin.server import StandInServer
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local stand-in for the football-data and footystats servers')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help='Serves the fixtures over HTTP')
+    serve_parser.add_argument('--fixtures', default='standin/fixtures/')
+    serve_parser.add_argument('--host', default='127.0.0.1')
+    serve_parser.add_argument('--port', type=int, default=8000)
+    serve_parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    serve_parser.add_argument('--jitter', type=float, default=0.0, help='Uniform extra latency, in seconds')
+    serve_parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests that fail')
+    serve_parser.add_argument('--error-status', type=int, default=503)
+    serve_parser.add_argument('--seed', type=int, default=None)
+
+    generate_parser = subparsers.add_parser('generate', help='Generates synthetic fixtures')
+    generate_parser.add_argument('--fixtures', default='standin/fixtures/')
+    generate_parser.add_argument('--first-season', type=int, default=2023)
+    generate_parser.add_argument('--seasons', type=int, default=3)
+    generate_parser.add_argument('--seed', type=int, default=0)
+
+    record_parser = subparsers.add_parser('record', help='Records fixtures from the live servers')
+    record_parser.add_argument('--fixtures', default='standin/fixtures/')
+    record_parser.add_argument('--available-leagues', default='available_leagues.csv')
+    record_parser.add_argument('--api-key', required=True)
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        server = StandInServer(
+            fixtures_directory=args.fixtures,
+            host=args.host,
+            port=args.port,
+            latency_seconds=args.latency,
+            latency_jitter_seconds=args.jitter,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            random_seed=args.seed
+        )
+        print(f'Serving {args.fixtures} at {server.base_url}')
+        print(f'FOOTBALL_DATA_BASE_URL={server.base_url} FOOTYSTATS_BASE_URL={server.base_url}')
+        server.serve_forever()
+    elif args.command == 'generate':
+        generate_fixtures(
+            fixtures_directory=args.fixtures,
+            first_season=args.first_season,
+            num_seasons=args.seasons,
+            random_seed=args.seed
+        )
+    else:
+        record_fixtures(
+            fixtures_directory=args.fixtures,
+            available_leagues_filepath=args.available_leagues,
+            api_key=args.api_key
+        )
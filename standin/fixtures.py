@@ -0,0 +1,186 @@
+import csv
+import json
+import os
+from datetime import date, datetime, timezone
+from urllib.parse import urlsplit
+
+import numpy as np
+import pandas as pd
+import requests
+
+from infra.clients.footballdata.main import MainLeagueAPI
+from infra.converters.team import teams
+from infra.repositories.registry import LeagueRegistry
+from standin.synthetic import generate_synthetic_league
+
+FootballDataUrl = 'https://www.football-data.co.uk'
+FootystatsUrl = 'https://api.football-data-api.com'
+
+# (country, league, football-data url, league type, footystats name, footystats team names)
+StandInLeagues = [
+    ('England', 'Premier-League', f'{FootballDataUrl}/mmz4281/{{}}/E0.csv', 'main', 'England Premier League',
+     list(teams.keys())[20:]),
+    ('Brazil', 'Serie-A', f'{FootballDataUrl}/new/BRA.csv', 'extra', 'Brazil Serie A', list(teams.keys())[:20])
+]
+
+
+def _write_json(data: dict, filepath: str):
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(filepath, 'w', encoding='utf-8') as fp:
+        json.dump(data, fp, ensure_ascii=False)
+
+
+def _get_football_data_filepath(fixtures_directory: str, url: str) -> str:
+    return os.path.join(fixtures_directory, 'football-data', *urlsplit(url).path.strip('/').split('/'))
+
+
+def _write_season_csv(matches_df: pd.DataFrame, filepath: str):
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    matches_df.to_csv(filepath, index=False)
+
+
+def generate_fixtures(
+        fixtures_directory: str,
+        first_season: int = 2023,
+        num_seasons: int = 3,
+        num_today_matches: int = 5,
+        random_seed: int = 0
+):
+    rng = np.random.default_rng(seed=random_seed)
+    league_list = []
+    league_teams = {}
+    today_matches = []
+    team_ids = {}
+
+    os.makedirs(fixtures_directory, exist_ok=True)
+    with open(os.path.join(fixtures_directory, 'available_leagues.csv'), 'w', encoding='utf-8', newline='') as fp:
+        writer = csv.writer(fp)
+        writer.writerow(['Country', 'League', 'Url', 'Year Start', 'League Type', 'Fixtures'])
+
+        for i, (country, name, url, league_type, external_name, team_names) in enumerate(StandInLeagues):
+            writer.writerow([country, name, url, first_season, league_type, f'{FootballDataUrl}/fixtures.csv'])
+
+            matches_df = generate_synthetic_league(
+                num_teams=len(team_names),
+                num_seasons=num_seasons,
+                first_season=first_season,
+                random_seed=random_seed + i
+            ).iloc[::-1]
+            matches_df[['Home Team', 'Away Team']] = matches_df[['Home Team', 'Away Team']].replace(
+                {f'Team {j}': teams[team_name] for j, team_name in enumerate(team_names)}
+            )
+
+            if league_type == 'main':
+                for season, season_df in matches_df.groupby('Season'):
+                    _write_season_csv(
+                        matches_df=season_df.drop(columns=['Season']).rename(columns={
+                            'Home Team': 'HomeTeam', 'Away Team': 'AwayTeam', '1': 'B365H', 'X': 'B365D', '2': 'B365A',
+                            'HG': 'FTHG', 'AG': 'FTAG', 'Result': 'FTR'
+                        }),
+                        filepath=_get_football_data_filepath(
+                            fixtures_directory=fixtures_directory,
+                            url=url.format(MainLeagueAPI._get_url_year_format(year=season))
+                        )
+                    )
+            else:
+                _write_season_csv(
+                    matches_df=matches_df.rename(columns={
+                        'Home Team': 'Home', 'Away Team': 'Away', '1': 'AvgH', 'X': 'AvgD', '2': 'AvgA', 'Result': 'Res'
+                    }),
+                    filepath=_get_football_data_filepath(fixtures_directory=fixtures_directory, url=url)
+                )
+
+            seasons = [
+                {'id': 1000 * (i + 1) + j, 'year': first_season + j} for j in range(num_seasons)
+            ]
+            league_list.append({'name': external_name, 'country': country, 'season': seasons})
+
+            for team_name in team_names:
+                team_ids[team_name] = len(team_ids) + 1
+            for season in seasons:
+                league_teams[season['id']] = [
+                    {'id': team_ids[team_name], 'name': team_name, 'competition_id': season['id']}
+                    for team_name in team_names
+                ]
+
+            kickoff = int(datetime.combine(date.today(), datetime.min.time(), tzinfo=timezone.utc).timestamp())
+            for j, (home_team, away_team) in enumerate(
+                    rng.permutation(team_names)[: 2 * num_today_matches].reshape((-1, 2))
+            ):
+                odds = np.round(rng.uniform(low=1.2, high=6.0, size=3), 2)
+                today_matches.append({
+                    'id': len(today_matches) + 1,
+                    'homeID': team_ids[home_team],
+                    'awayID': team_ids[away_team],
+                    'competition_id': seasons[-1]['id'],
+                    'game_week': 1,
+                    'date_unix': kickoff + 3600 * (16 + j % 6),
+                    'odds_ft_1': float(odds[0]),
+                    'odds_ft_x': float(odds[1]),
+                    'odds_ft_2': float(odds[2])
+                })
+
+    footystats_directory = os.path.join(fixtures_directory, 'footystats')
+    _write_json(
+        data={'success': True, 'data': league_list},
+        filepath=os.path.join(footystats_directory, 'league-list.json')
+    )
+    _write_json(
+        data={'success': True, 'data': today_matches},
+        filepath=os.path.join(footystats_directory, 'todays-matches.json')
+    )
+    for season_id, teams_data in league_teams.items():
+        _write_json(
+            data={'success': True, 'data': teams_data},
+            filepath=os.path.join(footystats_directory, 'league-teams', f'{season_id}.json')
+        )
+    for team_name, team_id in team_ids.items():
+        _write_json(
+            data={'success': True, 'data': [{'id': team_id, 'name': team_name}]},
+            filepath=os.path.join(footystats_directory, 'team', f'{team_id}.json')
+        )
+
+
+def record_fixtures(fixtures_directory: str, available_leagues_filepath: str, api_key: str):
+    session = requests.Session()
+
+    for league in LeagueRegistry(available_leagues_filepath=available_leagues_filepath).get_all().values():
+        if league.league_type == 'main':
+            url_list = MainLeagueAPI(session=session)._generate_url_list(league=league)
+        else:
+            url_list = [league.url]
+
+        for url in url_list:
+            response = session.get(url, timeout=(5, 30))
+            if response.status_code == 404:
+                break
+
+            response.raise_for_status()
+            filepath = _get_football_data_filepath(fixtures_directory=fixtures_directory, url=url)
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            with open(filepath, 'wb') as fp:
+                fp.write(response.content)
+
+    footystats_directory = os.path.join(fixtures_directory, 'footystats')
+    for endpoint, params in [
+        ('league-list', {'key': api_key, 'chosen_leagues_only': 'true'}),
+        ('todays-matches', {'key': api_key, 'timezone': '-03'})
+    ]:
+        response = session.get(f'{FootystatsUrl}/{endpoint}', params=params, timeout=(5, 30))
+        response.raise_for_status()
+        _write_json(data=response.json(), filepath=os.path.join(footystats_directory, f'{endpoint}.json'))
+
+    with open(os.path.join(footystats_directory, 'todays-matches.json'), 'r', encoding='utf-8') as fp:
+        today_matches = json.load(fp).get('data') or []
+    for season_id in sorted({match['competition_id'] for match in today_matches}):
+        response = session.get(
+            f'{FootystatsUrl}/league-teams', params={'key': api_key, 'season_id': season_id}, timeout=(5, 30)
+        )
+        response.raise_for_status()
+        _write_json(
+            data=response.json(), filepath=os.path.join(footystats_directory, 'league-teams', f'{season_id}.json')
+        )
+    for team_id in sorted({match[key] for match in today_matches for key in ['homeID', 'awayID']}):
+        response = session.get(f'{FootystatsUrl}/team', params={'key': api_key, 'team_id': team_id}, timeout=(5, 30))
+        response.raise_for_status()
+        _write_json(data=response.json(), filepath=os.path.join(footystats_directory, 'team', f'{team_id}.json'))
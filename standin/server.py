@@ -0,0 +1,139 @@
+import hashlib
+import os
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StandInServer:
+    FootystatsEndpoints = {'todays-matches', 'team', 'league-teams', 'league-list'}
+    FootystatsIdParameters = {'team': 'team_id', 'league-teams': 'season_id'}
+
+    def __init__(
+            self,
+            fixtures_directory: str,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            latency_seconds: float = 0.0,
+            latency_jitter_seconds: float = 0.0,
+            error_rate: float = 0.0,
+            error_status: int = 503,
+            random_seed: int or None = None
+    ):
+        self._fixtures_directory = fixtures_directory
+        self._latency_seconds = latency_seconds
+        self._latency_jitter_seconds = latency_jitter_seconds
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._rng = random.Random(random_seed)
+        self._lock = threading.Lock()
+        self._request_counts = {}
+        self._thread = None
+
+        self._server = ThreadingHTTPServer((host, port), self._create_handler())
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[: 2]
+        return f'http://{host}:{port}'
+
+    @property
+    def request_counts(self) -> dict:
+        with self._lock:
+            return dict(self._request_counts)
+
+    def start(self) -> 'StandInServer':
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'StandInServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _draw_delay_and_error(self) -> (float, bool):
+        with self._lock:
+            delay = self._latency_seconds + self._rng.uniform(0, self._latency_jitter_seconds)
+            return delay, self._rng.random() < self._error_rate
+
+    def _count_request(self, route: str):
+        with self._lock:
+            self._request_counts[route] = self._request_counts.get(route, 0) + 1
+
+    def _get_fixture_filepath(self, path: str, query: dict) -> str:
+        endpoint = path.strip('/')
+
+        if endpoint in self.FootystatsIdParameters:
+            entity_id = query[self.FootystatsIdParameters[endpoint]][0]
+            if not entity_id.isdigit():
+                raise KeyError(entity_id)
+
+            return os.path.join(self._fixtures_directory, 'footystats', endpoint, f'{entity_id}.json')
+        elif endpoint in self.FootystatsEndpoints:
+            return os.path.join(self._fixtures_directory, 'footystats', f'{endpoint}.json')
+        else:
+            return os.path.join(self._fixtures_directory, 'football-data', *path.strip('/').split('/'))
+
+    def _create_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url_parts = urlsplit(self.path)
+                server._count_request(route=url_parts.path)
+
+                delay, failed = server._draw_delay_and_error()
+                time.sleep(delay)
+                if failed:
+                    self.send_error(server._error_status)
+                    return
+
+                try:
+                    filepath = server._get_fixture_filepath(path=url_parts.path, query=parse_qs(url_parts.query))
+                except KeyError:
+                    self.send_error(400)
+                    return
+
+                if '..' in url_parts.path.split('/') or not os.path.isfile(filepath):
+                    self.send_error(404)
+                    return
+
+                with open(filepath, 'rb') as fp:
+                    content = fp.read()
+                etag = f'"{hashlib.sha1(content).hexdigest()}"'
+
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json' if filepath.endswith('.json') else 'text/csv')
+                self.send_header('Content-Length', str(len(content)))
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', formatdate(os.path.getmtime(filepath), usegmt=True))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
@@ -0,0 +1,44 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+
+def generate_synthetic_league(
+        num_teams: int,
+        num_seasons: int,
+        first_season: int = 2000,
+        random_seed: int = 0
+) -> pd.DataFrame:
+    rng = np.random.default_rng(seed=random_seed)
+    team_names = [f'Team {i}' for i in range(num_teams)] + [None] * (num_teams % 2)
+    rows = []
+
+    for season in range(first_season, first_season + num_seasons):
+        teams = list(rng.permutation(team_names))
+        matchday = date(year=season, month=8, day=1)
+        rounds = []
+
+        # Circle method: every team plays once per round, with home and away swapped in the second half.
+        for _ in range(len(teams) - 1):
+            rounds.append([(teams[i], teams[-1 - i]) for i in range(len(teams) // 2)])
+            teams = [teams[0], teams[-1]] + teams[1: -1]
+        rounds += [[(away_team, home_team) for home_team, away_team in fixtures] for fixtures in rounds]
+
+        for fixtures in rounds:
+            for home_team, away_team in fixtures:
+                if home_team is None or away_team is None:
+                    continue
+
+                home_goals, away_goals = rng.poisson(lam=1.5), rng.poisson(lam=1.1)
+                odds = np.round(rng.uniform(low=1.2, high=6.0, size=3), 2)
+                rows.append((
+                    matchday.strftime('%d/%m/%Y'), season, home_team, away_team, *odds, home_goals, away_goals,
+                    'H' if home_goals > away_goals else 'A' if away_goals > home_goals else 'D'
+                ))
+            matchday += timedelta(days=7)
+
+    matches_df = pd.DataFrame(
+        rows, columns=['Date', 'Season', 'Home Team', 'Away Team', '1', 'X', '2', 'HG', 'AG', 'Result']
+    )
+    return matches_df.iloc[::-1].reset_index(drop=True)
@@ -0,0 +1,48 @@
+import os
+from datetime import date, timedelta
+
+import pytest
+
+from infra.repositories.fixtures import FixturesRepository
+
+
+class StandInFootystatsClient:
+    def __init__(self, matches: list or None):
+        self.matches = matches
+        self.num_requests = 0
+
+    def get_today_matches(self) -> list or None:
+        self.num_requests += 1
+        return self.matches
+
+
+@pytest.mark.parametrize('matches', [None, []])
+def test_empty_fetch_is_not_snapshotted(tmp_path, matches):
+    footystats_client = StandInFootystatsClient(matches=matches)
+    assert FixturesRepository(footystats_client=footystats_client, fixtures_directory=f'{tmp_path}/').get_fixtures(
+        competition_id=1
+    ) == []
+    assert os.listdir(tmp_path) == []
+
+    # A later run of the day fetches again and pins the first non-empty response.
+    footystats_client.matches = [{'competition_id': 1, 'id': 10}]
+    assert FixturesRepository(footystats_client=footystats_client, fixtures_directory=f'{tmp_path}/').get_fixtures(
+        competition_id=1
+    ) == [{'competition_id': 1, 'id': 10}]
+    assert os.listdir(tmp_path) == [f'{date.today().isoformat()}.json']
+
+    footystats_client.matches = []
+    assert FixturesRepository(footystats_client=footystats_client, fixtures_directory=f'{tmp_path}/').get_fixtures(
+        competition_id=1
+    ) == [{'competition_id': 1, 'id': 10}]
+    assert footystats_client.num_requests == 2
+
+
+def test_past_day_without_snapshot_raises(tmp_path):
+    footystats_client = StandInFootystatsClient(matches=[{'competition_id': 1, 'id': 10}])
+
+    with pytest.raises(ValueError):
+        FixturesRepository(footystats_client=footystats_client, fixtures_directory=f'{tmp_path}/').get_fixtures(
+            competition_id=1, day=date.today() - timedelta(days=1)
+        )
+    assert footystats_client.num_requests == 0
@@ -0,0 +1,25 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from infra.clients.footystats.cache import FootystatsCache
+
+
+def test_concurrent_stores_leave_one_complete_entry(tmp_path):
+    footystats_cache = FootystatsCache(cache_directory=f'{tmp_path}/', ttl_seconds={'matches': 60})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(
+            lambda i: footystats_cache.store(endpoint='matches', key='today', data={'request': i}), range(64)
+        ))
+
+    assert os.listdir(f'{tmp_path}/matches') == ['today.json']
+    data = FootystatsCache(cache_directory=f'{tmp_path}/', ttl_seconds={'matches': 60}).load(
+        endpoint='matches', key='today'
+    )
+    assert data['request'] in range(64)
+
+
+def test_expired_entries_are_not_returned(tmp_path):
+    footystats_cache = FootystatsCache(cache_directory=f'{tmp_path}/', ttl_seconds={'matches': -1})
+    footystats_cache.store(endpoint='matches', key='today', data=[])
+    assert footystats_cache.load(endpoint='matches', key='today') is None
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip('tensorflow')
+
+from domain.usecases.job_matches_analyse import JobMatchesAnalyseUseCase
+
+
+def test_failing_league_does_not_stop_the_others():
+    async def build_inputs(item: dict) -> dict:
+        if item['league_name'] == 'Brasileirão':
+            raise RuntimeError('League file is corrupted')
+        return item
+
+    async def run_stage() -> (list, dict):
+        input_queue = asyncio.Queue()
+        output_queue = asyncio.Queue()
+        stage_timings = {}
+
+        for league_name in ['Brasileirão', 'Premier-League', None]:
+            await input_queue.put(None if league_name is None else {'league_name': league_name})
+
+        await JobMatchesAnalyseUseCase._JobMatchesAnalyseUseCase__run_stage(
+            stage='build_inputs',
+            worker_fn=build_inputs,
+            input_queue=input_queue,
+            output_queue=output_queue,
+            num_workers=2,
+            stage_timings=stage_timings
+        )
+        return [output_queue.get_nowait() for _ in range(output_queue.qsize())], stage_timings
+
+    items, stage_timings = asyncio.run(run_stage())
+    assert items == [{'league_name': 'Premier-League'}, None]
+    assert stage_timings['build_inputs'] >= 0.0
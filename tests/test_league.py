@@ -0,0 +1,89 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from domain.processing.statistics import StatisticsEngine
+from infra.repositories.league import LeagueRepository
+from standin.synthetic import generate_synthetic_league
+
+
+@pytest.fixture
+def league_repository(tmp_path) -> LeagueRepository:
+    return LeagueRepository(
+        available_leagues_filepath=str(tmp_path / 'available_leagues.csv'),
+        saved_leagues_directory=f'{tmp_path}/saved/',
+        num_previous_versions=2
+    )
+
+
+@pytest.fixture
+def matches_df() -> pd.DataFrame:
+    return generate_synthetic_league(num_teams=6, num_seasons=2, random_seed=3)
+
+
+def store_league(league_repository: LeagueRepository, matches_df: pd.DataFrame, league_name: str = 'league'):
+    league_repository._store_league(
+        matches_df=matches_df,
+        league_config={
+            'country': 'Country',
+            'name': 'League',
+            'last_n_matches': 3,
+            'goal_diff_margin': 2,
+            'statistic_columns': StatisticsEngine.Columns
+        },
+        league_name=league_name,
+        store_league_config=True
+    )
+
+
+def test_snapshots_are_versioned_and_pruned(league_repository, matches_df):
+    for num_matches in [60, 45, 30, 15]:
+        store_league(league_repository=league_repository, matches_df=matches_df.iloc[: num_matches])
+
+    assert league_repository.get_league_versions(league_name='league') == [2, 3, 4]
+    assert league_repository._get_current_version(league_name='league') == 4
+
+
+def test_concurrent_writes_keep_the_newest_version_current(league_repository, matches_df):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: store_league(league_repository=league_repository, matches_df=matches_df), range(8)))
+
+    assert league_repository.get_league_versions(league_name='league') == [6, 7, 8]
+    assert league_repository._get_current_version(league_name='league') == 8
+
+
+def test_rollback_skips_and_pruning_removes_version_placeholders(league_repository, matches_df):
+    for num_matches in [30, 45, 60]:
+        store_league(league_repository=league_repository, matches_df=matches_df.iloc[: num_matches])
+
+    # Earlier releases claimed a version with an empty snapshot file, left behind when the writer was killed.
+    open(league_repository._get_snapshot_filepath(league_name='league', version=2), 'w').close()
+
+    assert not league_repository.rollback_league(league_name='league', version=2)
+    assert league_repository.rollback_league(league_name='league')
+    assert league_repository._get_current_version(league_name='league') == 1
+    pd.testing.assert_frame_equal(
+        league_repository._read_league(league_name='league'),
+        league_repository._compute_statistics(
+            matches_df=matches_df.iloc[: 30],
+            league_config={'last_n_matches': 3, 'goal_diff_margin': 2, 'statistic_columns': StatisticsEngine.Columns}
+        ).reset_index(drop=True)
+    )
+
+    store_league(league_repository=league_repository, matches_df=matches_df)
+    assert league_repository.get_league_versions(league_name='league') == [1, 3, 4]
+    assert league_repository._get_current_version(league_name='league') == 4
+
+
+def test_latest_match_date_includes_dropped_rows(league_repository, matches_df):
+    # The saved league ends with the first round of a new season, which has no statistics yet and is not stored.
+    num_season_matches = int((matches_df['Season'] == matches_df['Season'].max()).sum())
+    history_df = matches_df.iloc[num_season_matches - 3:].reset_index(drop=True)
+    store_league(league_repository=league_repository, matches_df=history_df)
+
+    latest_match_date = pd.to_datetime(history_df['Date'], dayfirst=True).max().to_pydatetime()
+    assert league_repository._get_latest_date(
+        dates=league_repository._read_league(league_name='league')['Date']
+    ) < latest_match_date
+    assert league_repository.get_latest_match_date(league_name='league') == latest_match_date
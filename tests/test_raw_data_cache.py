@@ -0,0 +1,57 @@
+import os
+from datetime import date
+
+import pandas as pd
+
+from infra.clients.footballdata.cache import RawDataCache
+from infra.clients.footballdata.main import MainLeagueAPI
+from infra.repositories.registry import LeagueRegistry
+from standin.server import StandInServer
+
+FixturesDirectory = f'{os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}/standin/fixtures/'
+Url = 'https://www.football-data.co.uk/new/BRA.csv'
+
+
+def test_cache_hits_and_misses(tmp_path):
+    raw_data_cache = RawDataCache(raw_data_directory=f'{tmp_path}/raw/')
+    assert raw_data_cache.load(url=Url) == (None, None)
+
+    raw_data_cache.store(url=Url, content=b'a,b\n1,2\n', etag='"v1"', last_modified=None, immutable=False)
+    content, metadata = raw_data_cache.load(url=Url)
+    assert content == b'a,b\n1,2\n'
+    assert (metadata['etag'], metadata['immutable']) == ('"v1"', False)
+
+
+def test_cache_misses_when_metadata_describes_other_content(tmp_path):
+    raw_data_cache = RawDataCache(raw_data_directory=f'{tmp_path}/raw/')
+    raw_data_cache.store(url=Url, content=b'a,b\n1,2\n', etag='"v1"', last_modified=None, immutable=False)
+
+    # A crash between the two writes leaves the new content next to the previous validators.
+    with open(f'{raw_data_cache._get_filepath(url=Url)}.csv', 'wb') as fp:
+        fp.write(b'a,b\n1,2\n3,4\n')
+    assert raw_data_cache.load(url=Url) == (None, None)
+
+    with open(f'{raw_data_cache._get_filepath(url=Url)}.json', 'w', encoding='utf-8') as fp:
+        fp.write('{"url": ')
+    assert raw_data_cache.load(url=Url) == (None, None)
+
+
+def test_only_unfinished_seasons_are_revalidated(tmp_path):
+    league = LeagueRegistry(available_leagues_filepath=f'{FixturesDirectory}available_leagues.csv').get(
+        country='England', name='Premier-League'
+    )
+
+    with StandInServer(fixtures_directory=FixturesDirectory) as server, MainLeagueAPI(
+            raw_data_directory=f'{tmp_path}/raw/', base_url=server.base_url
+    ) as football_data_api:
+        matches_df = football_data_api.download(league=league)
+        first_request_counts = server.request_counts
+        pd.testing.assert_frame_equal(matches_df, football_data_api.download(league=league))
+        request_counts = server.request_counts
+
+    assert request_counts == {
+        f'/mmz4281/{MainLeagueAPI._get_url_year_format(year=year)}/E0.csv': first_request_counts[
+            f'/mmz4281/{MainLeagueAPI._get_url_year_format(year=year)}/E0.csv'
+        ] + int(not MainLeagueAPI._is_finished_season(year=year))
+        for year in range(league.year_start, date.today().year + 1)
+    }
@@ -0,0 +1,19 @@
+from infra.repositories.registry import LeagueRegistry
+
+FixturesUrl = 'https://www.football-data.co.uk/fixtures.csv'
+
+
+def test_leagues_sharing_a_fixtures_url_are_all_indexed(tmp_path):
+    available_leagues_filepath = tmp_path / 'available_leagues.csv'
+    available_leagues_filepath.write_text(
+        'Country,League,Url,Year Start,League Type,Fixtures\n'
+        f'England,Premier-League,https://www.football-data.co.uk/mmz4281/{{}}/E0.csv,2023,main,{FixturesUrl}\n'
+        f'Brazil,Serie-A,https://www.football-data.co.uk/new/BRA.csv,2023,extra,{FixturesUrl}\n',
+        encoding='utf-8'
+    )
+    league_registry = LeagueRegistry(available_leagues_filepath=str(available_leagues_filepath))
+
+    assert [(league.country, league.name) for league in league_registry.get_by_fixtures_url(FixturesUrl)] == [
+        ('England', 'Premier-League'), ('Brazil', 'Serie-A')
+    ]
+    assert league_registry.get_by_fixtures_url('https://example.com/fixtures.csv') == ()
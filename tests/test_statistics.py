@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+
+from domain.processing.statistics import RollingStatisticsEngine, StatisticsEngine
+from infra.repositories.league import LeagueRepository
+from standin.synthetic import generate_synthetic_league
+
+AllStatisticColumns = StatisticsEngine.Columns + StatisticsEngine.FormColumns + StatisticsEngine.HeadToHeadColumns
+
+
+@pytest.fixture
+def matches_df() -> pd.DataFrame:
+    return generate_synthetic_league(num_teams=8, num_seasons=3, random_seed=1)
+
+
+@pytest.mark.parametrize('last_n_matches, goal_diff_margin', [(1, 0), (3, 2), (5, 1)])
+def test_rolling_engine_matches_reference(matches_df, last_n_matches, goal_diff_margin):
+    expected_df = StatisticsEngine(
+        matches_df=matches_df, last_n_matches=last_n_matches, goal_diff_margin=goal_diff_margin
+    ).compute_statistics(statistic_columns=AllStatisticColumns)
+    engine = RollingStatisticsEngine(
+        matches_df=matches_df, last_n_matches=last_n_matches, goal_diff_margin=goal_diff_margin
+    )
+
+    pd.testing.assert_frame_equal(expected_df, engine.compute_statistics(statistic_columns=AllStatisticColumns))
+    pd.testing.assert_frame_equal(
+        expected_df, engine.compute_statistics(statistic_columns=AllStatisticColumns, fused=False)
+    )
+
+
+def test_statistics_cube_matches_reference(matches_df):
+    statistics_cube = RollingStatisticsEngine(
+        matches_df=matches_df, last_n_matches=3, goal_diff_margin=2
+    ).compute_statistics_cube(
+        statistic_columns=AllStatisticColumns, last_n_matches_list=[2, 4], goal_diff_margins=[1, 3]
+    )
+
+    for last_n_matches, goal_diff_margin in statistics_cube.parameters:
+        pd.testing.assert_frame_equal(
+            StatisticsEngine(
+                matches_df=matches_df, last_n_matches=last_n_matches, goal_diff_margin=goal_diff_margin
+            ).compute_statistics(statistic_columns=AllStatisticColumns),
+            statistics_cube.get(last_n_matches=last_n_matches, goal_diff_margin=goal_diff_margin)
+        )
+
+
+@pytest.mark.parametrize('statistic_columns', [StatisticsEngine.Columns, AllStatisticColumns])
+def test_incremental_append_matches_full_rebuild(tmp_path, matches_df, statistic_columns):
+    league_repository = LeagueRepository(
+        available_leagues_filepath=str(tmp_path / 'available_leagues.csv'),
+        saved_leagues_directory=f'{tmp_path}/saved/'
+    )
+    league_config = {
+        'country': 'Country',
+        'name': 'League',
+        'last_n_matches': 3,
+        'goal_diff_margin': 2,
+        'statistic_columns': statistic_columns
+    }
+
+    # Matches are stored newest first: the saved league ends with the previous season, then the first two rounds of
+    # the latest season arrive, and finally the rest of it.
+    num_latest_season_matches = int((matches_df['Season'] == matches_df['Season'].max()).sum())
+    league_repository._store_league(
+        matches_df=matches_df.iloc[num_latest_season_matches:].reset_index(drop=True),
+        league_config=league_config,
+        league_name='incremental',
+        store_league_config=True
+    )
+    for num_new_matches in [8, num_latest_season_matches]:
+        league_repository._append_league(
+            matches_df=matches_df.iloc[num_latest_season_matches - num_new_matches:].reset_index(drop=True),
+            league_config=league_config,
+            league_name='incremental'
+        )
+
+    league_repository._store_league(
+        matches_df=matches_df, league_config=league_config, league_name='full', store_league_config=True
+    )
+    pd.testing.assert_frame_equal(
+        league_repository._read_league(league_name='full'), league_repository._read_league(league_name='incremental')
+    )
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+
+from domain.processing.statistics import RollingStatisticsEngine, StatisticsEngine
+from domain.processing.team_form import TeamForm
+from infra.repositories.league import LeagueRepository
+from standin.synthetic import generate_synthetic_league
+
+
+def test_stored_head_to_head_matches_training_statistics(tmp_path):
+    matches_df = generate_synthetic_league(num_teams=8, num_seasons=3, random_seed=1)
+    statistic_columns = StatisticsEngine.Columns + StatisticsEngine.HeadToHeadColumns
+    league_repository = LeagueRepository(
+        available_leagues_filepath=str(tmp_path / 'available_leagues.csv'),
+        saved_leagues_directory=f'{tmp_path}/saved/'
+    )
+
+    # The newest match plays an upcoming fixture: served from the league stored before it was played, its
+    # head-to-head features must equal the ones training computes for it from the full match history.
+    league_repository._store_league(
+        matches_df=matches_df.iloc[1:].reset_index(drop=True),
+        league_config={
+            'country': 'Country',
+            'name': 'League',
+            'last_n_matches': 3,
+            'goal_diff_margin': 2,
+            'statistic_columns': statistic_columns
+        },
+        league_name='league',
+        store_league_config=True
+    )
+    statistics_df = RollingStatisticsEngine(
+        matches_df=matches_df, last_n_matches=3, goal_diff_margin=2
+    ).compute_statistics(statistic_columns=statistic_columns)
+
+    np.testing.assert_array_equal(
+        statistics_df.loc[0, StatisticsEngine.HeadToHeadColumns].to_numpy(dtype=np.float64),
+        np.array(
+            league_repository.load_team_form(league_name='league').get_head_to_head_features(
+                home_team=matches_df.loc[0, 'Home Team'], away_team=matches_df.loc[0, 'Away Team']
+            ),
+            dtype=np.float64
+        )
+    )
+
+
+def test_unknown_team_raises():
+    team_form = TeamForm.build(
+        matches_df=RollingStatisticsEngine(
+            matches_df=generate_synthetic_league(num_teams=8, num_seasons=3, random_seed=1),
+            last_n_matches=3,
+            goal_diff_margin=2
+        ).compute_statistics(statistic_columns=StatisticsEngine.Columns + StatisticsEngine.HeadToHeadColumns)
+    )
+
+    with pytest.raises(KeyError):
+        team_form.get_home_features(team='Unknown')
+    with pytest.raises(KeyError):
+        team_form.get_away_features(team='Unknown')
+    with pytest.raises(KeyError):
+        team_form.get_head_to_head_features(home_team='Team 0', away_team='Unknown')
+
+
+def test_team_seen_in_one_context_raises_for_the_other():
+    statistics_df = RollingStatisticsEngine(
+        matches_df=generate_synthetic_league(num_teams=8, num_seasons=3, random_seed=1),
+        last_n_matches=3,
+        goal_diff_margin=2
+    ).compute_statistics(statistic_columns=StatisticsEngine.Columns + StatisticsEngine.HeadToHeadColumns).dropna()
+    team_form = TeamForm.build(matches_df=statistics_df[statistics_df['Away Team'] != 'Team 7'])
+
+    assert team_form.has_team(team='Team 7')
+    assert not np.isnan(team_form.get_home_features(team='Team 7')).any()
+    with pytest.raises(KeyError):
+        team_form.get_away_features(team='Team 7')
+    with pytest.raises(ValueError):
+        team_form.construct_inputs(home_teams=['Team 0'], away_teams=['Team 7'], odds=np.ones((1, 3)))
+    assert not np.isnan(
+        team_form.construct_inputs(home_teams=['Team 7'], away_teams=['Team 0'], odds=np.ones((1, 3)))
+    ).any()
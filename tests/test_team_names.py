@@ -0,0 +1,38 @@
+import pytest
+
+from domain.processing.team_names import TeamNameResolver
+
+TeamNames = ['Atletico-GO', 'Atletico-MG', 'Bragantino', 'Ipswich', 'Leicester', 'Man City', 'Man United']
+
+
+@pytest.mark.parametrize('name, team_name', [
+    ('Ipswich Town', 'Ipswich'),
+    ('Leicester City', 'Leicester'),
+    ('Red Bull Bragantino', 'Bragantino'),
+    ('RB Bragantino', 'Bragantino'),
+    ('Atlético Goianiense', 'Atletico-GO'),
+    ('Atlético Mineiro', 'Atletico-MG'),
+    ('Atletico GO', 'Atletico-GO'),
+    ('Manchester City', 'Man City')
+])
+def test_resolves_league_names(name, team_name):
+    assert TeamNameResolver(team_names=TeamNames).resolve(name=name) == team_name
+
+
+def test_rejects_team_with_other_state_code():
+    team_name_resolver = TeamNameResolver(team_names=['Atletico-MG', 'Bragantino'], aliases={})
+
+    assert team_name_resolver.resolve(name='Atletico GO') is None
+    assert team_name_resolver.resolve(name='Atletico Goianiense') is None
+    assert team_name_resolver.resolve(name='Atletico MG') == 'Atletico-MG'
+
+
+def test_memoizes_fuzzy_matches(tmp_path):
+    memo_filepath = str(tmp_path / 'team_names' / 'league.json')
+
+    team_name_resolver = TeamNameResolver(team_names=['Bragantino'], memo_filepath=memo_filepath)
+
+    assert team_name_resolver.resolve(name='Bragantino Paulista') == 'Bragantino'
+    assert TeamNameResolver(team_names=['Bragantino'], memo_filepath=memo_filepath)._memo == {
+        'bragantino paulista': 'Bragantino'
+    }
@@ -1,4 +1,15 @@
+import os
+
 available_leagues_filepath = 'available_leagues.csv'
 saved_leagues_directory = 'storage/leagues/saved/'
 models_checkpoint_directory = 'storage/checkpoints/'
+feature_store_directory = 'storage/features/'
+feature_store_max_size_bytes = 512 * 2 ** 20
+raw_data_directory = 'storage/raw/'
+# The footystats API key is read from the FOOTYSTATS_API_KEY environment variable; the jobs fail fast without it.
+footystats_api_key = os.environ.get('FOOTYSTATS_API_KEY')
+footystats_cache_directory = 'storage/footystats/'
+fixtures_directory = 'storage/fixtures/'
+team_names_directory = 'storage/team_names/'
+num_previous_league_versions = 2
 random_seed = 0